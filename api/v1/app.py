@@ -7,20 +7,21 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
-from flask_jwt_extended import JWTManager
 from flasgger import Swagger
-from config import Config, mail, make_celery
+from config import Config, mail, cache, make_celery
 from api.v1.views import app_views
+from api.v1.utils.token_utils import CachedJWTManager
 from models import storage
 from os import getenv, environ
 from flask_mail import Message
+from sqlalchemy.exc import DBAPIError, StatementError
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config.from_object(Config)
 
-# Initialize JWTManager
-jwt = JWTManager(app)
+# Initialize JWTManager (verified tokens are cached per process)
+jwt = CachedJWTManager(app)
 
 # Initialize SQLAlchemy and Flask-Migrate
 db = SQLAlchemy(app)
@@ -29,6 +30,9 @@ migrate = Migrate(app, db)
 # Initialize Flask-Mail
 mail.init_app(app)
 
+# Initialize Flask-Caching
+cache.init_app(app)
+
 
 """
 with app.app_context():
@@ -160,6 +164,44 @@ def method_not_allowed_error(error) -> str:
     return jsonify({"error": message}), 405
 
 
+@app.errorhandler(429)
+def too_many_requests_error(error) -> str:
+    """
+    Handles 429 Too Many Requests errors.
+
+    Args:
+        error: The error object.
+
+    Returns:
+        A JSON response with the error message and a 429 status code.
+    """
+    message = getattr(error, "description", "Too Many Requests")
+    return jsonify({"error": message}), 429
+
+
+@app.errorhandler(StatementError)
+def invalid_value_error(error: StatementError) -> str:
+    """
+    Handles values the database types refuse to bind, such as a malformed
+    id in a request body (see UUIDType).
+
+    Args:
+        error: The error object.
+
+    Returns:
+        A JSON response with the error message and a 400 status code.
+
+    Raises:
+        StatementError: Any other statement error (including DBAPIError
+            subclasses such as OperationalError and IntegrityError) is
+            re-raised, so Flask logs it and answers with a 500.
+    """
+    # The session is rolled back when close_db() removes it at teardown
+    if isinstance(error, DBAPIError) or not isinstance(error.orig, ValueError):
+        raise error
+    return jsonify({"error": str(error.orig)}), 400
+
+
 @app.errorhandler(500)
 def internal_server_error(error) -> str:
     """
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Shared Redis Cache
+
+This module provides a thin JSON-over-Redis cache shared by every API
+worker process. It is used for data that is expensive to recompute but
+cheap to store, such as email domain deliverability checks. Never use
+it for anything trusted on read (verified JWT claims, permissions):
+whoever can write to Redis could plant values.
+
+The cache is strictly best-effort: the Redis client is created lazily
+with a short connect timeout, and any Redis error is treated as a cache
+miss so callers fall back to computing the value locally (tests without
+a Redis server keep working).
+
+Globals:
+    - shared_cache: The RedisCache instance used by the API.
+    - STATS_CACHE_KEY: Flask-Caching key of the /stats response.
+"""
+import json
+import redis
+from redis.exceptions import RedisError
+from config import Config, cache
+from typing import Any, Optional
+
+
+class RedisCache:
+    """
+    Best-effort JSON cache backed by Redis.
+    """
+
+    def __init__(self, prefix: str = "",
+                 connect_timeout: float = 0.05) -> None:
+        """
+        Initializes the cache without connecting to Redis.
+
+        Args:
+            prefix (str): Prefix prepended to every key.
+            connect_timeout (float): Socket timeout in seconds.
+        """
+        self.prefix = prefix
+        self.connect_timeout = connect_timeout
+        self._client = None
+
+    @property
+    def client(self) -> redis.Redis:
+        """
+        Returns the Redis client, creating it on first use.
+        """
+        if self._client is None:
+            if Config.REDIS_URL:
+                self._client = redis.Redis.from_url(
+                    Config.REDIS_URL,
+                    socket_connect_timeout=self.connect_timeout,
+                    socket_timeout=self.connect_timeout
+                )
+            else:
+                self._client = redis.Redis(
+                    host=Config.REDIS_HOST,
+                    port=Config.REDIS_PORT,
+                    db=Config.REDIS_DB,
+                    socket_connect_timeout=self.connect_timeout,
+                    socket_timeout=self.connect_timeout
+                )
+        return self._client
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value for a key.
+
+        Args:
+            key (str): The cache key (without prefix).
+
+        Returns:
+            Any: The decoded value, or None on a miss or Redis error.
+        """
+        try:
+            payload = self.client.get(self.prefix + key)
+        except RedisError:
+            return None
+        if payload is None:
+            return None
+        return json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Stores a value for `ttl` seconds. Non-positive TTLs are ignored.
+
+        Args:
+            key (str): The cache key (without prefix).
+            value (Any): A JSON-serializable value.
+            ttl (int): Time to live in seconds.
+        """
+        if ttl <= 0:
+            return
+        try:
+            self.client.set(self.prefix + key, json.dumps(value), ex=ttl)
+        except RedisError:
+            pass
+
+    def delete(self, key: str) -> None:
+        """
+        Removes a key from the cache.
+
+        Args:
+            key (str): The cache key (without prefix).
+        """
+        try:
+            self.client.delete(self.prefix + key)
+        except RedisError:
+            pass
+
+
+# Cache shared by all API workers
+shared_cache = RedisCache()
+
+# Key of the cached /stats response (see api/v1/views/index.py)
+STATS_CACHE_KEY = "stats"
+
+
+def invalidate_stats() -> None:
+    """
+    Drops the cached /stats response so the next request recounts.
+
+    Call this after creating or deleting users. Cache errors are ignored;
+    the entry then simply expires after its timeout.
+    """
+    try:
+        cache.delete(STATS_CACHE_KEY)
+    except RedisError:
+        pass
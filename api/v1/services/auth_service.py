@@ -1,17 +1,42 @@
 #!/usr/bin/env python3
 """
-This module contains a custom decorator function,
-`admin_required`, which ensures that a user has 'admin'
-privileges before allowing access to the decorated route.
+This module contains custom decorator functions for protecting routes:
 
-It uses JWT tokens to verify the role of the user and
-restricts access to the route if the user does not have
-the 'admin' role.
+- `admin_required` ensures that a user has 'admin' privileges before
+  allowing access to the decorated route. It uses JWT tokens to verify
+  the role of the user and restricts access to the route if the user
+  does not have the 'admin' role.
+- `rate_limited` caps how many requests a client IP may make to the
+  decorated route within a time window, using Redis counters.
 """
-from flask import jsonify
+from flask import jsonify, abort, request
 from flask_jwt_extended import get_jwt
 from functools import wraps
 from typing import Callable, Any
+import redis
+from redis.exceptions import RedisError
+from config import Config
+
+# The limiter's own client, with short timeouts so an unreachable Redis
+# fails open quickly instead of stalling every rate-limited request
+_limiter_client = redis.StrictRedis(
+    host=Config.REDIS_HOST,
+    port=Config.REDIS_PORT,
+    db=Config.REDIS_DB,
+    socket_connect_timeout=Config.RATE_LIMIT_REDIS_TIMEOUT,
+    socket_timeout=Config.RATE_LIMIT_REDIS_TIMEOUT
+)
+
+# Increments a counter and starts its expiry on the first hit, in one
+# atomic step, so a failure between the two can't leave a counter that
+# never expires
+_INCR_WITH_EXPIRY = _limiter_client.register_script("""
+local attempts = redis.call('INCR', KEYS[1])
+if attempts == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return attempts
+""")
 
 
 def admin_required(fn: Callable[..., Any]) -> Callable[..., Any]:
@@ -42,3 +67,42 @@ def admin_required(fn: Callable[..., Any]) -> Callable[..., Any]:
         return fn(*args, **kwargs)
 
     return wrapper
+
+
+def rate_limited(limit: int, window: int,
+                 key_prefix: str) -> Callable[..., Any]:
+    """
+    A decorator factory limiting requests per client IP address.
+
+    Each request increments a Redis counter that expires after `window`
+    seconds; once the counter passes `limit`, the route responds with 429.
+    If Redis is unavailable or slower than RATE_LIMIT_REDIS_TIMEOUT, the
+    request is let through.
+
+    Args:
+        limit (int): Maximum number of requests allowed per window.
+        window (int): Window length in seconds.
+        key_prefix (str): Prefix for the Redis counter key.
+
+    Returns:
+        Callable[..., Any]: The decorator.
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = f"{key_prefix}:{request.remote_addr}"
+            try:
+                # First request in this window starts the clock
+                attempts = _INCR_WITH_EXPIRY(keys=[key], args=[window])
+            except RedisError:
+                attempts = 0
+
+            if attempts > limit:
+                abort(429, description="Too many requests, "
+                                       "please try again later.")
+
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
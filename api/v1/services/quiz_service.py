@@ -81,8 +81,9 @@ def get_questions_for_quiz(quiz_id: str, storage: Any) -> List[Question]:
         abort(404, description="Quiz not found")
 
     # Fetch all questions for the quiz and sort them by order_number
-    questions = storage.filter_by(Question, quiz_id=quiz_id)
-    questions.sort(key=lambda q: q.order_number)
+    questions = storage.query(Question).filter_by(
+        quiz_id=quiz_id
+    ).order_by(Question.order_number).all()
 
     question_list = [question.to_json() for question in questions]
 
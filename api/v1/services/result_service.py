@@ -87,17 +87,12 @@ def get_quiz_results_for_user(
     Returns:
         A list of results for the user, as JSON-serializable dictionaries.
     """
+    filters = {"user_id": user_id}
     if quiz_id:
-        # Fetch results filtered by user_id and quiz_id
-        results = storage.filter_by(Result, user_id=user_id, quiz_id=quiz_id)
-    else:
-        # Fetch all results for the user
-        results = storage.filter_by(Result, user_id=user_id)
-
-    # Sort results by creation date
-    results.sort(key=lambda q: q.created_at, reverse=True)
+        filters["quiz_id"] = quiz_id
 
-    return [result.to_json() for result in results]
+    # Read-only listing: serialize straight from column rows, newest first
+    return Result.list_dicts(storage, **filters)
 
 
 def add_result(data: Dict[str, Any], storage: Any) -> tuple:
@@ -10,6 +10,7 @@ Time limits and duplicate submissions are strictly enforced.
 from flask import jsonify, abort
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
+from models.base_model import time_format
 from models.user_answer import UserAnswer
 from models.user import User
 from models.choice import Choice
@@ -77,7 +78,8 @@ def get_result_answers_for_user(
         storage: The storage handler for querying data.
 
     Returns:
-        A list of user answers for the user, as JSON-serializable dictionaries.
+        A list of user answers for the user, as JSON-serializable dictionaries,
+        newest first.
 
     Notes:
         - You may provide either parameter or neither,
@@ -90,23 +92,18 @@ def get_result_answers_for_user(
         if not result:
             abort(404, description="Result not found")
         # Fetch user answers filtered by user_id and result_id
-        user_answers = storage.filter_by(UserAnswer,
-                                         user_id=user_id,
-                                         result_id=result_id)
+        user_answers = UserAnswer.get_user_answers(storage, user_id,
+                                                   result_id=result_id)
     elif quiz_id:
         quiz = get_quiz_by_id(quiz_id, storage)
         if not quiz:
             abort(404, description="Quiz not found")
         # Fetch all user answers for the user filtered by quiz_id
-        user_answers = storage.filter_by(UserAnswer,
-                                         user_id=user_id,
-                                         quiz_id=quiz_id)
+        user_answers = UserAnswer.get_user_answers(storage, user_id,
+                                                   quiz_id=quiz_id)
     else:
         # Fetch all user answers for the user
-        user_answers = storage.filter_by(UserAnswer, user_id=user_id)
-
-    # Sort user answers by creation date
-    user_answers.sort(key=lambda q: q.created_at, reverse=True)
+        user_answers = UserAnswer.get_user_answers(storage, user_id)
 
     return [user_answer.to_json() for user_answer in user_answers]
 
@@ -200,8 +197,13 @@ def add_user_answer(data: Dict[str, Any], storage: Any) -> tuple:
         abort(400, description="answers must be in a list.")
 
     user_answers = []
+    # Answers queued in this request; they are not in the session, so
+    # duplicates within the payload are caught here rather than by the
+    # existing-answer queries below
+    pending_choices = set()
+    pending_questions = set()
 
-    # Create UserAnswer entries for each answer in the list
+    # Build UserAnswer rows for each answer in the list
     for answer in answers:
         question_id = answer.get('question_id')
         choice_id = answer.get('choice_id')
@@ -228,7 +230,7 @@ def add_user_answer(data: Dict[str, Any], storage: Any) -> tuple:
                                                  question_id=question_id,
                                                  choice_id=choice_id)
 
-        if existing_user_answer:
+        if existing_user_answer or (question_id, choice_id) in pending_choices:
             abort(400, description=(
                 f"User Answer for question {question_id} "
                 f"and choice {choice_id} already exists for this user!"
@@ -242,29 +244,31 @@ def add_user_answer(data: Dict[str, Any], storage: Any) -> tuple:
                                                 user_id=user_id,
                                                 quiz_id=quiz_id,
                                                 question_id=question_id)
-            if existing_answer:
+            if existing_answer or question_id in pending_questions:
                 abort(400, description=(
                     f"The question with ID {question_id} allows only one "
                     "correct choice. Please use the update route to modify "
                     "your existing answer."
                 ))
 
-        user_answer = UserAnswer(user_id=user.id,
-                                 result_id=result.id,
-                                 question_id=question.id,
-                                 choice_id=choice.id,
-                                 quiz_id=quiz_id)
-
-        storage.new(user_answer)
-        user_answers.append(user_answer)
+        pending_choices.add((question_id, choice_id))
+        pending_questions.add(question_id)
+        user_answers.append({'user_id': user.id,
+                             'result_id': result.id,
+                             'question_id': question.id,
+                             'choice_id': choice.id,
+                             'quiz_id': quiz_id})
 
-    # Save all answers to the database at once
+    # Insert all answers with one multi-row statement and commit
+    UserAnswer.bulk_create(storage, user_answers)
     storage.save()
 
     # Return the list of answers submitted
-    return jsonify(
-        [user_answer.to_json() for user_answer in user_answers]
-        ), 201
+    return jsonify([
+        {key: value.strftime(time_format) if isinstance(value, datetime)
+         else value for key, value in user_answer.items()}
+        for user_answer in user_answers
+    ]), 201
 
 
 def update_user_answer_by_id(data: Dict[str, Any],
@@ -308,7 +312,7 @@ def update_user_answer_by_id(data: Dict[str, Any],
         ))
 
     # Ensure the quiz time limit has not expired
-    quiz = result.quiz
+    quiz = get_quiz_by_id(result.quiz_id, storage)
     print(quiz)
     print(f"quiz id: {quiz.id}")
     # Convert to seconds
@@ -1,18 +1,78 @@
 #!/usr/bin/python3
 """
-Helper functions for sending password reset emails.
+Helper functions for sending password reset emails and validating
+email addresses.
 
 This module contains functions to generate a password reset URL and send
 an email with the reset instructions. The email includes a link with a
 reset token and instructions on resetting the password.
 
-Main function:
+Main functions:
     - `send_password_reset_email(user_email, reset_token)`: Sends an
       email to the user with a password reset link and instructions.
+    - `email_validation_error(email)`: Validates an address (syntax and
+      domain deliverability) and returns the error message, if any.
+      Syntax results are memoized per process; domains found deliverable
+      are shared through Redis for an hour. Failed deliverability checks
+      are never cached, since email-validator also reports transient
+      DNS failures (e.g. SERVFAIL) as undeliverable.
 """
 from flask_mail import Message
 from flask import url_for
+from email_validator import validate_email, EmailNotValidError
+from functools import lru_cache
+from typing import Optional, Tuple
 from config import mail
+from api.v1.cache import shared_cache
+
+# How long a domain found deliverable (MX lookup) is trusted
+DELIVERABILITY_TTL = 3600
+
+
+@lru_cache(maxsize=8192)
+def _check_email_syntax(email: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Validates the syntax of an address; pure, so results are memoized.
+
+    Args:
+        email (str): The address to validate.
+
+    Returns:
+        tuple: (normalized domain, None) if valid, else (None, error).
+    """
+    try:
+        valid = validate_email(email, check_deliverability=False)
+    except EmailNotValidError as e:
+        return None, str(e)
+    return valid.domain, None
+
+
+def email_validation_error(email: str) -> Optional[str]:
+    """
+    Validates an email address like email_validator.validate_email with
+    its default deliverability check, reusing earlier results.
+
+    Args:
+        email (str): The address to validate.
+
+    Returns:
+        Optional[str]: The validation error message, or None if valid.
+    """
+    domain, error = _check_email_syntax(email)
+    if error is not None:
+        return error
+
+    key = f"email_deliverability:{domain}"
+    if shared_cache.get(key):
+        return None
+
+    try:
+        validate_email(email)
+    except EmailNotValidError as e:
+        # Not cached: the failure may be a transient DNS error
+        return str(e)
+    shared_cache.set(key, True, DELIVERABILITY_TTL)
+    return None
 
 
 def send_password_reset_email(user_email, reset_token):
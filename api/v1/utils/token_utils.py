@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Verified JWT Cache
+
+This module provides a JWTManager that remembers the claims of tokens it
+has already verified. Clients send the same access/refresh token on many
+consecutive requests, so repeat hits skip PyJWT's signature check and
+claim validation and return the cached claims after a dictionary lookup.
+
+Entries are keyed by a 16-byte BLAKE2b digest of the encoded token, are
+only served while the token's `exp` claim is in the future, and are
+bounded in number (least recently used entries are dropped first).
+
+The cache is deliberately per process: claims are never read back from
+a store another process could write to. Evicting a token only forgets
+its verified claims; revocation is still the blocklist's job.
+
+Main items:
+    - `CachedJWTManager`: Drop-in replacement for JWTManager.
+    - `evict_token(encoded_token)`: Forgets a token (e.g. on logout).
+"""
+from collections import OrderedDict
+from hashlib import blake2b
+from flask_jwt_extended import JWTManager
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+# Upper bound on cached tokens per process
+_MAX_ENTRIES = 4096
+
+# digest -> (exp timestamp or None, decoded claims)
+_cache: "OrderedDict[bytes, Tuple[Optional[float], Dict[str, Any]]]" = (
+    OrderedDict()
+)
+_lock = threading.Lock()
+
+
+def _token_key(encoded_token: str) -> bytes:
+    """
+    Returns the cache key for an encoded token.
+
+    Args:
+        encoded_token (str): The encoded JWT.
+
+    Returns:
+        bytes: A 16-byte BLAKE2b digest of the token.
+    """
+    return blake2b(encoded_token.encode(), digest_size=16).digest()
+
+
+def evict_token(encoded_token: str) -> None:
+    """
+    Removes a token from the verified-token cache.
+
+    Args:
+        encoded_token (str): The encoded JWT to forget.
+    """
+    with _lock:
+        _cache.pop(_token_key(encoded_token), None)
+
+
+def clear_token_cache() -> None:
+    """
+    Empties the verified-token cache.
+    """
+    with _lock:
+        _cache.clear()
+
+
+class CachedJWTManager(JWTManager):
+    """
+    JWTManager that caches the claims of successfully verified tokens.
+
+    Only plain decodes are cached; decodes that check a CSRF value or
+    accept expired tokens always go through full verification. Blocklist
+    and user lookup callbacks still run on every request because they
+    happen after decoding.
+    """
+
+    def _decode_jwt_from_config(self, encoded_token: str,
+                                csrf_value: Optional[str] = None,
+                                allow_expired: bool = False) -> dict:
+        """
+        Returns the claims of a token, verifying it only on a cache miss.
+
+        Args:
+            encoded_token (str): The encoded JWT.
+            csrf_value (str, optional): CSRF value to check against.
+            allow_expired (bool): Whether expired tokens are accepted.
+
+        Returns:
+            dict: The decoded claims.
+        """
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(
+                encoded_token, csrf_value, allow_expired
+            )
+
+        key = _token_key(encoded_token)
+        with _lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                exp, claims = entry
+                if exp is None or exp > time.time():
+                    _cache.move_to_end(key)
+                    return dict(claims)
+                # Expired: drop it and let PyJWT raise the usual error
+                del _cache[key]
+
+        claims = super()._decode_jwt_from_config(encoded_token)
+
+        with _lock:
+            _cache[key] = (claims.get("exp"), dict(claims))
+            if len(_cache) > _MAX_ENTRIES:
+                _cache.popitem(last=False)
+        return claims
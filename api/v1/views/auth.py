@@ -18,10 +18,14 @@ from models.refresh_token import RefreshToken
 from api.v1.views import app_views
 from config import redis_client, Config
 from api.v1.utils.email_utils import send_password_reset_email
+from api.v1.utils.token_utils import evict_token
+from api.v1.services.auth_service import rate_limited
 from flask.typing import ResponseReturnValue
 
 
 @app_views.route('/login', methods=['POST'])
+@rate_limited(Config.LOGIN_RATE_LIMIT, Config.LOGIN_RATE_WINDOW,
+              "login_attempts")
 def login() -> ResponseReturnValue:
     """
     Authenticates a user by verifying their credentials
@@ -39,6 +43,7 @@ def login() -> ResponseReturnValue:
         and refresh token.
       - 400 if required fields are missing.
       - 403 if user is not found or password is incorrect.
+      - 429 if the client IP made too many login attempts.
       - 500 for internal server errors.
     """
     # Ensure request data is JSON
@@ -64,6 +69,10 @@ def login() -> ResponseReturnValue:
     if not user or not user.check_password(str(password)):
         abort(403, description="Invalid credentials!")
 
+    # Lazily migrate legacy bcrypt hashes (or outdated Argon2 parameters)
+    if user.needs_rehash():
+        user.set_password(str(password))
+
     # Create access token and refresh tokens with custom claims
     access_token = create_access_token(
         identity=user.id,
@@ -164,11 +173,14 @@ def logout() -> ResponseReturnValue:
             ))
     else:
         # Fallback to the database if the token is not in Redis
-        db_refresh_token = storage.query(RefreshToken).filter_by(
-            user_id=current_user,
-            id=refresh_token_id,
-            token=request_refresh_token
-        ).first()
+        db_refresh_token = RefreshToken.get_by_token(
+            storage, request_refresh_token
+        )
+        if db_refresh_token and (
+            db_refresh_token.user_id != current_user
+            or db_refresh_token.id != refresh_token_id
+        ):
+            db_refresh_token = None
 
         if not db_refresh_token or db_refresh_token.is_expired:
             abort(401, description=(
@@ -182,6 +194,8 @@ def logout() -> ResponseReturnValue:
         int(refresh_token_exp.total_seconds()),
         "blacklisted"
     )
+    # Drop the verified claims so the token is fully re-checked next time
+    evict_token(request_refresh_token)
 
     # Mark the refresh token as expired in the database
     db_refresh_token = storage.query(RefreshToken).filter_by(
@@ -225,11 +239,10 @@ def forgot_password() -> ResponseReturnValue:
         abort(404, description="User not found")
 
     # Generate a reset token and save it
-    user.generate_reset_token()
-    print(user.reset_token)
+    reset_token = user.generate_reset_token()
     print(user.email)
 
-    message = send_password_reset_email(user.email, user.reset_token)
+    message = send_password_reset_email(user.email, reset_token)
     # Return the success response immediately
     message = (
         'An email has been sent to your email address '
@@ -238,7 +251,7 @@ def forgot_password() -> ResponseReturnValue:
 
     return jsonify({
         "message": message,
-        "reset token": user.reset_token
+        "reset token": reset_token
         }), 200
 
 
@@ -255,15 +268,14 @@ def reset_password(token: str = None) -> ResponseReturnValue:
     """
     if not token:
         abort(404, description="Token ID is required")
-    user = storage.get_by_value(User, "reset_token", token)
+    user = storage.get_by_value(
+        User, "reset_token_hash", User.hash_reset_token(token)
+    )
 
     # Check if user and token are valid
     if not user:
         abort(400, description="Invalid or expired reset token")
 
-    if user.token_expiry.tzinfo is None:
-        user.token_expiry = user.token_expiry.replace(tzinfo=timezone.utc)
-
     if datetime.now(timezone.utc) > user.token_expiry:
         abort(400, description="Token has expired")
 
@@ -281,7 +293,7 @@ def reset_password(token: str = None) -> ResponseReturnValue:
 
     user.set_password(data.get('new_password'))
     print(f"Password: {user.password}")
-    user.reset_token = None
+    user.reset_token_hash = None
     user.token_expiry = None
     user.save()
 
@@ -7,6 +7,8 @@ from models import storage
 from models.user import User
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from api.v1.services.auth_service import admin_required
+from api.v1.cache import STATS_CACHE_KEY
+from config import cache
 from flask.typing import ResponseReturnValue
 
 
@@ -43,9 +45,13 @@ def status() -> ResponseReturnValue:
 
 
 @app_views.route('/stats/', strict_slashes=False)
+@cache.cached(timeout=30, key_prefix=STATS_CACHE_KEY)
 def stats() -> ResponseReturnValue:
     """
     Returns the number of each objects
+
+    The counts are cached for 30 seconds and dropped whenever a user is
+    created or deleted (see api.v1.cache.invalidate_stats).
     """
     stats = {}
     stats['users'] = storage.count(User)
@@ -203,8 +203,9 @@ def get_quiz_questions(quiz_id: str = None) -> ResponseReturnValue:
         return jsonify(question.to_json()), 200
 
     # Fetch all questions for the quiz and sort them by order_number
-    questions = storage.filter_by(Question, quiz_id=quiz_id)
-    questions.sort(key=lambda q: q.order_number)
+    questions = storage.query(Question).filter_by(
+        quiz_id=quiz_id
+    ).order_by(Question.order_number).all()
 
     # Convert questions to JSON format
     question_list = [question.to_json() for question in questions]
@@ -711,15 +712,10 @@ def stop_quiz():
         abort(400, description="Quiz has already been completed or timed out.")
 
     # Fetch the associated quiz from the result object
-    quiz = result.quiz
-    print(f"result.quiz: {result.quiz}")
+    quiz = get_quiz_by_id(result.quiz_id, storage)
     if not quiz:
         abort(404, description="Quiz not found")
 
-    # Ensure result.start_time is timezone-aware (if it isn't already)
-    if result.start_time.tzinfo is None:
-        result.start_time = result.start_time.replace(tzinfo=timezone.utc)
-
     # Check if the quiz time has expired
     time_limit_expired = current_time > (
         result.start_time + timedelta(minutes=quiz.time_limit)
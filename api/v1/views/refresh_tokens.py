@@ -19,6 +19,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from flask_jwt_extended import create_access_token, create_refresh_token
 from api.v1.services.auth_service import admin_required
 from api.v1.utils.pagination_utils import get_paginated_data
+from api.v1.utils.token_utils import evict_token
 from models.refresh_token import RefreshToken
 from api.v1.services.refresh_token_service import get_refresh_token_by_id
 from flask.typing import ResponseReturnValue
@@ -212,10 +213,14 @@ def refresh_token() -> ResponseReturnValue:
             ))
     else:
         # Fallback to the database if the token is not in Redis
-        db_refresh_token = storage.query(RefreshToken).filter_by(
-            user_id=current_user, id=refresh_token_id,
-            token=request_refresh_token
-        ).first()
+        db_refresh_token = RefreshToken.get_by_token(
+            storage, request_refresh_token
+        )
+        if db_refresh_token and (
+            db_refresh_token.user_id != current_user
+            or db_refresh_token.id != refresh_token_id
+        ):
+            db_refresh_token = None
 
         if not db_refresh_token:
             # Separate error for non-existent token
@@ -249,6 +254,7 @@ def refresh_token() -> ResponseReturnValue:
         int(refresh_token_exp.total_seconds()),
         "blacklisted"
     )
+    evict_token(request_refresh_token)
 
     # Store the new refresh token in Redis
     redis_client.setex(redis_key,
@@ -254,8 +254,7 @@ def get_result_feedback(result_id: str) -> ResponseReturnValue:
         abort(400, description="Quiz has not been completed or timed out yet.")
 
     # Fetch the associated quiz from the result object
-    quiz = result.quiz
-    quiz = get_quiz_by_id(quiz.id, storage)
+    quiz = get_quiz_by_id(result.quiz_id, storage)
     if not quiz:
         abort(404, description="Quiz not found")
 
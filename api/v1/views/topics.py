@@ -148,22 +148,30 @@ def get_topic_quizzes(topic_id: str = None) -> ResponseReturnValue:
     if not topic:
         abort(404, description="Topic not found")
 
+    # Load the whole subtree and all of its quizzes in two queries
+    subtree = Topic.descendants(storage, topic.id)
+    children: Dict[str, List[Topic]] = {}
+    for node in subtree:
+        children.setdefault(node.parent_id, []).append(node)
+
+    quizzes_by_topic: Dict[str, List[Dict]] = {}
+    topic_quizzes = storage.query(Quiz).filter(
+        Quiz.topic_id.in_([node.id for node in subtree])
+    ).all()
+    for quiz in topic_quizzes:
+        quizzes_by_topic.setdefault(quiz.topic_id, []).append(quiz.to_json())
+
     def fetch_quizzes_by_topic(topic: Topic) -> List[Dict]:
         """
-        Recursively fetch quizzes grouped by the topic and its subtopics,
+        Recursively group quizzes by the topic and its subtopics,
         filtering out topics or subtopics without quizzes.
         """
-        # Fetch quizzes for the current topic
-        topic_quizzes = storage.get_by_value(Quiz, 'topic_id', topic.id)
-        quizzes = []
-        if topic_quizzes:
-            if isinstance(topic_quizzes, Quiz):
-                topic_quizzes = [topic_quizzes]
-            quizzes = [quiz.to_json() for quiz in topic_quizzes]
-
-        # Recursively fetch subtopics with quizzes
+        # Quizzes for the current topic
+        quizzes = quizzes_by_topic.get(topic.id, [])
+
+        # Recursively collect subtopics with quizzes
         subtopic_data = []
-        for subtopic in topic.subtopics:
+        for subtopic in children.get(topic.id, []):
             subtopic_quizzes = fetch_quizzes_by_topic(subtopic)
             # Include only if subtopic has quizzes
             if subtopic_quizzes:
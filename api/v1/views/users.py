@@ -20,13 +20,14 @@ from datetime import datetime, timezone
 from models import storage
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_jwt_extended import get_jwt, verify_jwt_in_request
-from email_validator import validate_email, EmailNotValidError
 from api.v1.utils.pagination_utils import get_paginated_data
 from flask.typing import ResponseReturnValue
 from api.v1.services.auth_service import admin_required
 from api.v1.services.result_service import get_quiz_results_for_user
 from api.v1.services.user_answer_service import get_result_answers_for_user
 from api.v1.utils.string_utils import format_text_to_title
+from api.v1.cache import invalidate_stats
+from api.v1.utils.email_utils import email_validation_error
 
 
 @app_views.route('/users', methods=['GET'], strict_slashes=False)
@@ -225,6 +226,7 @@ def delete_user(user_id: str = None) -> ResponseReturnValue:
     # Delete the user
     user.delete()
     storage.save()
+    invalidate_stats()
 
     return jsonify({"message": "User successfully deleted."}), 200
 
@@ -283,10 +285,9 @@ def create_user() -> ResponseReturnValue:
 
     # Validate email format
     email = data.get('email')
-    try:
-        validate_email(email)  # Validate email format
-    except EmailNotValidError as e:
-        return jsonify({'error': f'Invalid email format: {e}'}), 400
+    error = email_validation_error(email)  # Validate email format
+    if error:
+        return jsonify({'error': f'Invalid email format: {error}'}), 400
 
     # Check for existing username
     username = data.get('username')
@@ -337,6 +338,7 @@ def create_user() -> ResponseReturnValue:
         instance.save()
     except Exception as e:
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+    invalidate_stats()
 
     return jsonify({
         "message": "User created successfully",
@@ -423,11 +425,10 @@ def update_user(user_id: str = None) -> ResponseReturnValue:
                 continue
 
             if field == 'email':
-                try:
-                    validate_email(value)
-                except EmailNotValidError as e:
+                error = email_validation_error(value)
+                if error:
                     return jsonify({
-                        'error': f'Invalid email format: {e}'
+                        'error': f'Invalid email format: {error}'
                     }), 400
 
                 # Ensure no other user has this email
@@ -2,6 +2,7 @@ from dotenv import load_dotenv
 import redis
 from celery import Celery
 from flask_mail import Mail
+from flask_caching import Cache
 from datetime import timedelta
 import os
 """
@@ -12,6 +13,7 @@ sets up key services such as Redis, Celery, and Flask-Mail.
 - Configures Flask settings, including database and JWT authentication.
 - Sets up Redis for caching and task queue management.
 - Initializes Flask-Mail for email handling.
+- Creates the Flask-Caching instance for short-lived response caching.
 - Provides a factory function to create a Celery instance.
 
 Classes:
@@ -24,6 +26,7 @@ Functions:
 Globals:
     - redis_client: Redis client instance for interacting with the cache.
     - mail: Flask-Mail instance for handling email communication.
+    - cache: Flask-Caching instance (bound to the app in api/v1/app.py).
 """
 # Load environment variables from .env
 load_dotenv()
@@ -48,6 +51,21 @@ class Config:
     REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
     REDIS_DB = int(os.getenv("REDIS_DB", 0))
 
+    # Flask-Caching settings (short-lived view caches such as /stats)
+    CACHE_TYPE = os.getenv("CACHE_TYPE", "RedisCache")
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 30))
+    CACHE_REDIS_HOST = REDIS_HOST
+    CACHE_REDIS_PORT = REDIS_PORT
+    CACHE_REDIS_DB = REDIS_DB
+    CACHE_KEY_PREFIX = "quizypal:"
+
+    # Login rate limiting (attempts per client IP per window)
+    LOGIN_RATE_LIMIT = int(os.getenv("LOGIN_RATE_LIMIT", 10))
+    LOGIN_RATE_WINDOW = int(os.getenv("LOGIN_RATE_WINDOW", 60))
+    # Socket timeout (seconds) for the limiter's Redis calls; on timeout
+    # the request is let through rather than held up
+    RATE_LIMIT_REDIS_TIMEOUT = float(os.getenv("RATE_LIMIT_REDIS_TIMEOUT", 0.1))
+
     # Flask-Mail settings
     MAIL_SERVER = "smtp.gmail.com"
     MAIL_PORT = 465
@@ -69,6 +87,9 @@ redis_client = redis.StrictRedis(
 # Mail instance
 mail = Mail()
 
+# Cache instance
+cache = Cache()
+
 
 # Celery factory
 def make_celery(app):
@@ -423,7 +423,7 @@ def add_answer(
     )
     user_answer.save()
     print(
-        f"Answer added for user '{user_answer.user.username}' "
+        f"Answer added for user '{user_id}' "
         f"in quiz '{quiz_title}'!"
         )
     return user_answer
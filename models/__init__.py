@@ -2,10 +2,28 @@
 """
 Initializes the models package by setting up the storage engine and
 loading any existing data into memory.
+
+Set QUIZYPAL_NO_DB=1 to use a database-free NullStorage instead (for
+unit tests that mock every database access). This is refused unless
+FLASK_ENV is 'test', so a stray variable can't make a deployed app
+silently discard every write.
 """
-from models.engine.db_storage import DBStorage
+from os import getenv
 
 
 # Initialize the storage engine, which will manage database operations
-storage = DBStorage()
-storage.reload()
+if getenv('QUIZYPAL_NO_DB'):
+    if getenv('FLASK_ENV') != 'test':
+        raise RuntimeError(
+            "QUIZYPAL_NO_DB is set but FLASK_ENV is not 'test'; "
+            "NullStorage discards all writes and is only for unit tests"
+        )
+
+    from models.engine.null_storage import NullStorage
+
+    storage = NullStorage()
+else:
+    from models.engine.db_storage import DBStorage
+
+    storage = DBStorage()
+    storage.reload()
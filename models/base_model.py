@@ -5,7 +5,9 @@ This class provides common functionality like saving instances to the database,
 converting objects to dictionaries, and managing instance IDs and timestamps.
 """
 
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import BINARY, TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
 from datetime import datetime, timezone
@@ -19,6 +21,117 @@ time_format = "%Y-%m-%dT%H:%M:%S.%f"
 Base = declarative_base()
 
 
+def _parse_uuid(value: Any) -> uuid.UUID:
+    """
+    Parses an id in the canonical form ids are stored and compared in.
+
+    Only uuid.UUID objects and lowercase 36-character dashed strings are
+    accepted. Other spellings uuid.UUID() understands (braces, urn:uuid:,
+    undashed or uppercase hex) are refused, since they would not compare
+    equal to the stored id as plain strings.
+
+    Args:
+        value (Any): A UUID or its canonical string form.
+
+    Returns:
+        uuid.UUID: The parsed UUID.
+
+    Raises:
+        ValueError: If the value is not a canonical UUID.
+    """
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        parsed = uuid.UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        parsed = None
+    if parsed is None or str(parsed) != value:
+        raise ValueError(f"Invalid UUID: {value!r}")
+    return parsed
+
+
+def is_valid_uuid(value: Any) -> bool:
+    """
+    Checks whether a value can be stored in a UUIDType column.
+
+    Args:
+        value (Any): A UUID or its canonical string form.
+
+    Returns:
+        bool: True if the value is a UUID or a canonical UUID string.
+    """
+    try:
+        _parse_uuid(value)
+    except ValueError:
+        return False
+    return True
+
+
+class UUIDType(TypeDecorator):
+    """
+    Compact UUID column type used for every primary and foreign key.
+
+    Stored as native UUID on PostgreSQL and as BINARY(16) elsewhere, while
+    Python code keeps working with the canonical 36-character string form.
+    Binding a value that is not in that form raises ValueError (wrapped in
+    a StatementError by SQLAlchemy) rather than writing NULL; callers
+    handling outside input should check it with is_valid_uuid() first.
+    """
+    impl = BINARY(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Any) -> Any:
+        """Uses the native UUID type on PostgreSQL."""
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(postgresql.UUID())
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value: Optional[Any],
+                           dialect: Any) -> Optional[Any]:
+        """Converts a UUID string to the dialect's storage format."""
+        if value is None:
+            return None
+        value = _parse_uuid(value)
+        if dialect.name == 'postgresql':
+            return str(value)
+        return value.bytes
+
+    def process_result_value(self, value: Optional[Any],
+                             dialect: Any) -> Optional[str]:
+        """Converts a stored UUID back to its string form."""
+        if value is None:
+            return None
+        if dialect.name == 'postgresql':
+            return str(value)
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    DateTime column type that always hands back timezone-aware UTC values.
+
+    Values are stored as naive UTC (MySQL DATETIME has no timezone) and
+    get their tzinfo re-attached when loaded, so callers never have to
+    patch tzinfo onto loaded attributes before comparing them.
+    """
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime],
+                           dialect: Any) -> Optional[datetime]:
+        """Converts aware datetimes to naive UTC before storing them."""
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: Optional[datetime],
+                             dialect: Any) -> Optional[datetime]:
+        """Marks loaded datetimes as UTC."""
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
 class BaseModel():
     """
     BaseModel class that serves as the foundation for all model classes.
@@ -28,7 +141,7 @@ class BaseModel():
     """
 
     # Define columns for the model
-    id: str = Column(String(60),
+    id: str = Column(UUIDType,
                      primary_key=True,
                      default=lambda: str(uuid.uuid4()))
 
@@ -121,18 +234,27 @@ class BaseModel():
         """ Convert the object to a JSON dictionary """
         # from models.user import Role
 
+        # Loaded relationships live in __dict__ too; never serialize them.
+        # Neither are private attributes that aren't mapped columns, such
+        # as the instance state or cached strings.
+        mapper = getattr(type(self), '__mapper__', None)
+        relationships = mapper.relationships.keys() if mapper else ()
+        columns = mapper.column_attrs.keys() if mapper else ()
+
         result = {}
         for key, value in self.__dict__.items():
+            if key in relationships:
+                continue
+            if key[0] == '_' and key not in columns:
+                continue
             if not for_serialization:
                 if (
-                    key in ['password', 'reset_token', 'token_expiry', 'is_correct']
+                    key in ['password', 'reset_token_hash', 'token_expiry', 'is_correct']
                     or (key == 'choice_text' and value == 'no_answer')
                     or key[0] == '_'
                     ):  # noqa
                     continue
 
-            if key == '_sa_instance_state':
-                continue
             if key == "time_limit":
                 key = "time_limit (in mins)"
             if key == "time_taken":
@@ -4,7 +4,7 @@ Holds the class Choice, representing a choice for a question in the system.
 This class interacts with the database via SQLAlchemy for data persistence.
 """
 
-from models.base_model import BaseModel, Base
+from models.base_model import BaseModel, Base, UUIDType
 from sqlalchemy import Column, String, Boolean, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 from typing import Optional
@@ -25,8 +25,8 @@ class Choice(BaseModel, Base):
 
     __tablename__ = 'choices'
 
-    question_id: str = Column(String(60), ForeignKey('questions.id'), nullable=False, index=True)
-    choice_text: str = Column(String(255, collation='utf8mb4_general_ci'), nullable=False, default="no_answer")
+    question_id: str = Column(UUIDType, ForeignKey('questions.id'), nullable=False, index=True)
+    choice_text: str = Column(String(255).with_variant(String(255, collation='utf8mb4_general_ci'), 'mysql'), nullable=False, default="no_answer")
     is_correct: bool = Column(Boolean, nullable=False, default=False)
     order_number: int = Column(Integer, nullable=False)  # New field
 
@@ -2,12 +2,16 @@
 """
 Contains the class DBStorage for interacting with the MySQL database.
 """
+from datetime import datetime, timezone
 from os import getenv
-from sqlalchemy import create_engine
+import warnings
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from typing import Optional, Any, Union, List, Type, Dict
 
-from models.base_model import Base, BaseModel
+from models.base_model import Base, BaseModel, is_valid_uuid
 from models.user import User
 from models.refresh_token import RefreshToken
 from models.topic import Topic
@@ -20,14 +24,16 @@ import models
 # from sqlalchemy.exc import OperationalError
 
 
-classes = {"User": User,
-           "RefreshToken": RefreshToken,
-           "Topic": Topic,
-           "Quiz": Quiz,
-           "Question": Question,
-           "Choice": Choice,
-           "UserAnswer": UserAnswer,
-           "Result": Result}
+classes = (User, RefreshToken, Topic, Quiz, Question, Choice, UserAnswer,
+           Result)
+
+# Registered model classes as a set for O(1) membership checks
+_CLASS_SET = frozenset(classes)
+
+# Mapped column names per model, computed once so that filter lookups
+# do not go through descriptor resolution on every call.
+_ALLOWED_FIELDS = {cls: set(cls.__mapper__.columns.keys())
+                   for cls in classes}
 
 
 class DBStorage:
@@ -37,6 +43,9 @@ class DBStorage:
     """
     __engine: Optional[Any] = None
     __session: Optional[Any] = None
+    # Engines shared by every DBStorage instance, keyed on database URL,
+    # so connection pools and compiled statement caches stay warm.
+    __engines: Dict[str, Any] = {}
 
     def __init__(self) -> None:
         """
@@ -52,14 +61,43 @@ class DBStorage:
         else:
             DATABASE_URL = getenv('DATABASE_URL')
         
-        self.__engine = create_engine(DATABASE_URL)
+        engine = DBStorage.__engines.get(DATABASE_URL)
+        if engine is None:
+            if make_url(DATABASE_URL).get_backend_name() == 'sqlite':
+                # One shared connection, so an in-memory database
+                # survives across checkouts (and threads) in tests
+                engine = create_engine(
+                    DATABASE_URL,
+                    query_cache_size=1200,
+                    poolclass=StaticPool,
+                    connect_args={'check_same_thread': False}
+                )
+            else:
+                # Pool sizing is tunable per deployment through the
+                # environment
+                engine = create_engine(
+                    DATABASE_URL,
+                    query_cache_size=1200,
+                    pool_size=int(getenv('DB_POOL_SIZE', '10')),
+                    max_overflow=int(getenv('DB_MAX_OVERFLOW', '20')),
+                    pool_timeout=int(getenv('DB_POOL_TIMEOUT', '30')),
+                    pool_recycle=1800,
+                    pool_pre_ping=True
+                )
+            DBStorage.__engines[DATABASE_URL] = engine
+        self.__engine = engine
 
         if FLASK_ENV == "test":
             # Drop all tables in the test database
             Base.metadata.drop_all(self.__engine)
 
     def query(self, cls):
-        """Query the database using the current session."""
+        """
+        Query the database using the current session.
+
+        Prefer this (or get()/filter_by()) over all() so that filtering
+        and ordering happen in SQL.
+        """
         return self.__session.query(cls)
 
 
@@ -77,19 +115,55 @@ class DBStorage:
             Dict[str, Base]: A dictionary with keys as '<class_name>.<id>'
                             and values as the corresponding object instances.
         """
-        new_dict = {}
         if cls:
-            objs = self.__session.query(cls).all()
-        else:
-            objs = []
-            for clss in classes.values():
-                objs.extend(self.__session.query(clss).all())
-        for obj in objs:
-            key = f"{obj.__class__.__name__}.{obj.id}"
-            new_dict[key] = obj
+            prefix = cls.__name__ + "."
+            return {prefix + obj.id: obj
+                    for obj in self.__session.query(cls).all()}
+
+        warnings.warn(
+            "DBStorage.all() loads full tables; prefer "
+            "get()/filter_by()/query()",
+            DeprecationWarning, stacklevel=2
+        )
+        new_dict = {}
+        for clss in classes:
+            prefix = clss.__name__ + "."
+            new_dict.update({prefix + obj.id: obj
+                             for obj in self.__session.query(clss).all()})
         return new_dict
 
 
+    def stream(self, cls: Type[Base], *, columns: Optional[list] = None):
+        """
+        Streams rows of the given class in batches instead of loading the
+        whole table at once.
+
+        Args:
+            cls (Type[Base]): The class to read.
+            columns (list, optional): Specific columns to select (e.g.
+                [User.id, User.email]). Defaults to the full entity.
+
+        Returns:
+            Result: An iterable SQLAlchemy result fetched 1000 rows at a
+                    time through a server-side cursor.
+        """
+        stmt = select(*(columns or [cls])).execution_options(yield_per=1000)
+        return self.__session.execute(stmt)
+
+    def execute(self, statement: Any, params: Optional[dict] = None):
+        """
+        Executes a Core/ORM statement (including lambda statements) on the
+        current session.
+
+        Args:
+            statement: The statement to execute.
+            params (dict, optional): Bound parameter values.
+
+        Returns:
+            Result: The SQLAlchemy result object.
+        """
+        return self.__session.execute(statement, params)
+
     def new(self, obj: Base) -> None:
         """
         Adds a new object to the current database session.
@@ -102,7 +176,11 @@ class DBStorage:
     def save(self) -> None:
         """
         Commits all changes of the current database session to the database.
+
+        Sessions do not autoflush, so pending changes are flushed here
+        explicitly, in one batch, right before the commit.
         """
+        self.__session.flush()
         self.__session.commit()
 
     def delete(self, obj: Optional[Base] = None) -> None:
@@ -120,10 +198,19 @@ class DBStorage:
         Reloads data from the database and creates all tables defined in
         the Base model.
 
-        Sets up a session factory and a scoped session.
+        Sets up a session factory and a scoped session. Calling it again
+        on an already loaded instance is a no-op, so existing sessions and
+        their connections are not orphaned.
+
+        Autoflush is disabled: queries do not flush pending objects first,
+        and everything is written in one flush by save(). The scoped
+        session is removed at the end of every request (see close()).
         """
+        if self.__session is not None:
+            return
         Base.metadata.create_all(self.__engine)
-        sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
+        sess_factory = sessionmaker(bind=self.__engine, autoflush=False,
+                                    expire_on_commit=False)
         Session = scoped_session(sess_factory)
         self.__session = Session
 
@@ -137,7 +224,7 @@ class DBStorage:
     def get(self, cls: Type[Base], id: int) -> Optional[Base]:
         """
         Returns the object based on the class name and its unique ID, or
-        None if not found.
+        None if not found. Malformed ids are never found.
 
         Args:
             cls (Type[Base]): The class type to query.
@@ -146,7 +233,7 @@ class DBStorage:
         Returns:
             Optional[Base]: The object if found, otherwise None.
         """
-        if cls not in classes.values():
+        if cls not in _CLASS_SET or not is_valid_uuid(id):
             return None
 
         # Use SQLAlchemy to query the database for the object by ID
@@ -172,7 +259,7 @@ class DBStorage:
                                              a list of objects if multiple matches are found,
                                              or None if no matches are found.
         """
-        if cls not in classes.values() or not hasattr(cls, field):
+        if cls not in _CLASS_SET or field not in _ALLOWED_FIELDS[cls]:
             return None
         try:
             query = self.__session.query(cls).filter(getattr(cls, field) == value)
@@ -198,15 +285,29 @@ class DBStorage:
         Returns:
             int: The number of objects in storage.
         """
-        if cls and cls in classes.values():
+        if cls and cls in _CLASS_SET:
             return self.__session.query(cls).count()
         elif cls is None:
             count = 0
-            for clss in classes.values():
+            for clss in classes:
                 count += self.__session.query(clss).count()
             return count
         return 0
     
+    def purge_expired_tokens(self) -> None:
+        """
+        Deletes every expired refresh token with a single server-side
+        DELETE statement.
+
+        The expiry predicate is evaluated by the database using the
+        single-column expires_at index, so expired rows are never loaded
+        into the session.
+        """
+        self.__session.query(RefreshToken).filter(
+            RefreshToken.expires_at < datetime.now(timezone.utc)
+        ).delete(synchronize_session=False)
+        self.__session.commit()
+
     def filter_by(self, cls: Type[Base], **filters) -> list:
         """
         Filters objects by specified criteria.
@@ -218,11 +319,14 @@ class DBStorage:
         Returns:
             list: List of matching objects.
         """
-        if cls not in classes.values():
+        if cls not in _CLASS_SET:
             return []
 
-        query = self.__session.query(cls)
-        for field, value in filters.items():
-            if hasattr(cls, field):
-                query = query.filter(getattr(cls, field) == value)
-        return query.all()
+        # Drop unknown fields; the select below is served from
+        # SQLAlchemy's compiled statement cache on repeat calls.
+        bad = filters.keys() - _ALLOWED_FIELDS[cls]
+        if bad:
+            filters = {k: v for k, v in filters.items() if k not in bad}
+        return self.__session.execute(
+            select(cls).filter_by(**filters)
+        ).scalars().all()
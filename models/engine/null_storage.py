@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Contains the class NullStorage, a database-free stand-in for DBStorage.
+
+NullStorage is used when the QUIZYPAL_NO_DB environment variable is set
+together with FLASK_ENV=test (see models/__init__.py), for unit tests
+that mock every database access. No engine is created, no tables are built and no connection is
+opened; reads behave like an empty database and writes are discarded.
+"""
+from typing import Optional, Any, Union, List, Type, Dict
+
+from models.base_model import Base
+# Imported for its side effect: every model class gets mapped, so string
+# relationship targets resolve exactly as they do with DBStorage
+from models.engine import db_storage  # noqa: F401
+
+
+class _NullResult:
+    """
+    Empty stand-in for a SQLAlchemy Result.
+    """
+
+    def __iter__(self):
+        """Iterates over no rows."""
+        return iter(())
+
+    def scalars(self) -> '_NullResult':
+        """Returns this result; it has no rows to unwrap."""
+        return self
+
+    def all(self) -> list:
+        """Returns an empty list."""
+        return []
+
+    def first(self) -> None:
+        """Returns None; there is no first row."""
+        return None
+
+    def scalar(self) -> None:
+        """Returns None; there is no row to take a value from."""
+        return None
+
+    def scalar_one_or_none(self) -> None:
+        """Returns None; there is no row."""
+        return None
+
+
+class _NullQuery(_NullResult):
+    """
+    Empty stand-in for a SQLAlchemy Query; every refinement returns the
+    same empty query.
+    """
+
+    def _chain(self, *args: Any, **kwargs: Any) -> '_NullQuery':
+        """Ignores the refinement and returns this query."""
+        return self
+
+    filter = filter_by = options = order_by = limit = offset = _chain
+    join = outerjoin = group_by = distinct = _chain
+
+    def count(self) -> int:
+        """Returns 0."""
+        return 0
+
+    def delete(self, *args: Any, **kwargs: Any) -> int:
+        """Deletes nothing and returns 0 rows affected."""
+        return 0
+
+
+class NullStorage:
+    """
+    Storage with the DBStorage interface that never touches a database.
+    """
+
+    def query(self, cls) -> _NullQuery:
+        """
+        Returns an empty query.
+        """
+        return _NullQuery()
+
+    def all(self, cls: Optional[Type[Base]] = None) -> Dict[str, Base]:
+        """
+        Returns an empty dictionary.
+        """
+        return {}
+
+    def stream(self, cls: Type[Base], *, columns: Optional[list] = None):
+        """
+        Returns an empty result.
+        """
+        return _NullResult()
+
+    def execute(self, statement: Any, params: Optional[dict] = None):
+        """
+        Returns an empty result without running the statement.
+        """
+        return _NullResult()
+
+    def new(self, obj: Base) -> None:
+        """
+        Discards the object.
+        """
+
+    def save(self) -> None:
+        """
+        Does nothing; there is nothing to commit.
+        """
+
+    def delete(self, obj: Optional[Base] = None) -> None:
+        """
+        Does nothing; there is nothing to delete.
+        """
+
+    def reload(self) -> None:
+        """
+        Does nothing; there are no tables or sessions to set up.
+        """
+
+    def close(self) -> None:
+        """
+        Does nothing; there is no session to remove.
+        """
+
+    def get(self, cls: Type[Base], id: int) -> None:
+        """
+        Returns None; no object exists.
+        """
+        return None
+
+    def get_by_value(
+        self, cls: Type[Base], field: str, value: Any
+    ) -> Union[Optional[Any], List[Any]]:
+        """
+        Returns None; no object matches.
+        """
+        return None
+
+    def count(self, cls: Optional[Type[Base]] = None) -> int:
+        """
+        Returns 0.
+        """
+        return 0
+
+    def purge_expired_tokens(self) -> None:
+        """
+        Does nothing; there are no tokens.
+        """
+
+    def filter_by(self, cls: Type[Base], **filters) -> list:
+        """
+        Returns an empty list.
+        """
+        return []
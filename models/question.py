@@ -4,8 +4,8 @@ Holds the class Question, representing a question in the system.
 This class interacts with the database via SQLAlchemy for data persistence.
 """
 
-from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, Boolean, ForeignKey, Index, Integer, UniqueConstraint
+from models.base_model import BaseModel, Base, UUIDType
+from sqlalchemy import Column, String, Boolean, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 from typing import Optional
 
@@ -26,8 +26,8 @@ class Question(BaseModel, Base):
 
     __tablename__ = 'questions'
 
-    quiz_id: str = Column(String(60), ForeignKey('quizzes.id'), nullable=False)
-    question_text: str = Column(String(255, collation='utf8mb4_general_ci'), nullable=False)
+    quiz_id: str = Column(UUIDType, ForeignKey('quizzes.id'), nullable=False)
+    question_text: str = Column(String(255).with_variant(String(255, collation='utf8mb4_general_ci'), 'mysql'), nullable=False)
     order_number: int = Column(Integer, nullable=False)
     allow_multiple_answers: bool = Column(Boolean, default=False, nullable=False)
 
@@ -42,8 +42,12 @@ class Question(BaseModel, Base):
 
     # Add indexes for optimized searches and constraints for uniqueness
     __table_args__ = (
-        Index('idx_quiz_id_id', 'quiz_id', 'id'),  # Composite index
-        UniqueConstraint('quiz_id', 'question_text', name='uq_quiz_question_text'),  # Unique constraint
+        # Composite index serving per-quiz fetches in order_number order
+        Index('idx_questions_quiz_order', 'quiz_id', 'order_number'),
+        # Unique per quiz; only the first 191 characters of the text are
+        # indexed so the utf8mb4 key stays under InnoDB's 767-byte limit
+        Index('uq_quiz_question_text', 'quiz_id', 'question_text',
+              unique=True, mysql_length={'question_text': 191}),
     )
 
     def __init__(self, *args: tuple, **kwargs: dict) -> None:
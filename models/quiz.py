@@ -4,7 +4,7 @@ Holds the class Quiz, representing a quiz in the system.
 This class interacts with the database via SQLAlchemy for data persistence.
 """
 
-from models.base_model import BaseModel, Base
+from models.base_model import BaseModel, Base, UUIDType
 from sqlalchemy import Column, String, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from typing import Optional
@@ -26,11 +26,11 @@ class Quiz(BaseModel, Base):
     __tablename__ = 'quizzes'
 
     # Foreign Key to associate quiz with a topic (optional, since a quiz may have no topic)
-    topic_id: Optional[str] = Column(String(60), ForeignKey('topics.id', ondelete='SET NULL'), nullable=True)
+    topic_id: Optional[str] = Column(UUIDType, ForeignKey('topics.id', ondelete='SET NULL'), nullable=True)
     
     # Fields related to the quiz
     title: str = Column(String(128), nullable=False, unique=True)  # Ensure quiz title is unique
-    description: Optional[str] = Column(String(255, collation='utf8mb4_general_ci'), nullable=True)
+    description: Optional[str] = Column(String(255).with_variant(String(255, collation='utf8mb4_general_ci'), 'mysql'), nullable=True)
     time_limit: int = Column(Integer, nullable=False)
 
     # Relationships to link to Topic and Result tables
@@ -4,8 +4,9 @@ Defines the RefreshToken model for managing refresh tokens in the system.
 Each token is linked to a specific user and includes expiration handling, as well as device identification.
 """
 
-from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Index, Boolean
+from models.base_model import BaseModel, Base, UTCDateTime, UUIDType
+from sqlalchemy import Column, String, ForeignKey, Text, Index, Boolean
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone, timedelta
 import secrets
@@ -26,14 +27,22 @@ class RefreshToken(BaseModel, Base):
     __tablename__ = 'refresh_tokens'
 
     token: str = Column(String(512), nullable=False, unique=True, index=True)
-    user_id: str = Column(String(60), ForeignKey('users.id'), nullable=False, index=True)
-    expires_at: datetime = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc) + timedelta(days=7))
+    user_id: str = Column(UUIDType, ForeignKey('users.id'), nullable=False)
+    expires_at: datetime = Column(UTCDateTime, nullable=False, default=lambda: datetime.now(timezone.utc) + timedelta(days=7))
     is_expired: bool = Column(Boolean, nullable=False, default=False)
     # device_id: str = Column(String(128), nullable=False, unique=True)  # New field for device ID
 
     # Define a relationship back to the User model
     user = relationship('User', back_populates='refresh_tokens')
-    
+
+    # (user_id, expires_at) serves per-user lookups and expiry checks, and
+    # also backs the user_id foreign key. purge_expired_tokens() filters on
+    # expires_at alone, which can't use that index, so it gets its own.
+    __table_args__ = (
+        Index('idx_rt_user_expires', 'user_id', 'expires_at'),
+        Index('idx_rt_expires', 'expires_at'),
+    )
+
     def __init__(self, *args: tuple, **kwargs: dict) -> None:
         """
         Initializes a user object, passing any arguments to the
@@ -42,6 +51,27 @@ class RefreshToken(BaseModel, Base):
         super().__init__(*args, **kwargs)
 
 
+    @classmethod
+    def get_by_token(cls, storage, token: str) -> Optional['RefreshToken']:
+        """
+        Looks up a refresh token row by its token string.
+
+        This runs on every database fallback during refresh/logout, so the
+        statement is built with lambda_stmt: its compiled form is cached
+        by lambda identity and only the token value is bound per call.
+
+        Args:
+            storage (Storage): The storage instance to interact with the database.
+            token (str): The refresh token string.
+
+        Returns:
+            Optional[RefreshToken]: The matching token, or None.
+        """
+        stmt = lambda_stmt(
+            lambda: select(RefreshToken).where(RefreshToken.token == token)
+        )
+        return storage.execute(stmt).scalar_one_or_none()
+
     def generate_token(self, expiry_days: int = 7, device_id: Optional[str] = None) -> None:
         """
         Generates a new refresh token, sets its expiration time, and associates it with a device.
@@ -72,9 +102,6 @@ class RefreshToken(BaseModel, Base):
         Returns:
             bool: True if the token has expired, False otherwise.
         """
-        # Make sure both are timezone-aware
-        now = datetime.now(timezone.utc)
-        if self.expires_at.tzinfo is None:  # If expires_at is naive
-            self.expires_at = self.expires_at.replace(tzinfo=timezone.utc)
-        
-        return now > self.expires_at
+        # expires_at is loaded as an aware UTC datetime by UTCDateTime,
+        # so this check never writes back to the instance.
+        return datetime.now(timezone.utc) > self.expires_at
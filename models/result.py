@@ -4,11 +4,13 @@ Holds the class Result, representing a result/quiz attempt for a user.
 This class interacts with the database via SQLAlchemy for data persistence.
 """
 
-from models.base_model import BaseModel, Base
-from sqlalchemy import Column, Float, String, Integer, ForeignKey, Enum, DateTime, Index
+from models.base_model import BaseModel, Base, UTCDateTime, time_format, UUIDType
+from sqlalchemy import Column, SmallInteger, Integer, ForeignKey, Enum, Index, func, select
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from enum import Enum as PyEnum
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta, time
+from typing import Any, Dict, List, Optional
 
 
 
@@ -31,10 +33,14 @@ class QuizSessionStatus(PyEnum):
         Returns:
             Role: Corresponding Role enum member.
         """
-        for status in cls:
-            if status.value == status_str.lower():
-                return status
-        raise ValueError(f"Invalid role: {status_str}. Must be one of {[s.value for s in cls]}")
+        status = cls._value_index.get(status_str.lower())
+        if status is None:
+            raise ValueError(f"Invalid role: {status_str}. Must be one of {[s.value for s in cls]}")
+        return status
+
+
+# Value -> member lookup table shared by every QuizSessionStatus.from_str call
+QuizSessionStatus._value_index = {member.value: member for member in QuizSessionStatus}
 
 
 class Result(BaseModel, Base):
@@ -45,7 +51,8 @@ class Result(BaseModel, Base):
     Attributes:
         user_id (str): The ID of the user who took the quiz.
         quiz_id (str): The ID of the quiz taken.
-        score (decimal): The score the user obtained on this quiz attempt.
+        score (float): The score the user obtained on this quiz attempt
+            (stored in hundredths as a SMALLINT).
         time_taken (int): Time taken to complete the quiz in seconds.
         status (str): The status of the quiz attempt (in-progress/completed/timed-out).
         submitted_at (timestamp): The timestamp when the quiz was submitted.
@@ -56,26 +63,31 @@ class Result(BaseModel, Base):
     __tablename__ = 'results'
 
     # Foreign Keys to associate result with a user and a quiz
-    user_id: str = Column(String(60), ForeignKey('users.id'), nullable=False)
-    quiz_id: str = Column(String(60), ForeignKey('quizzes.id'), nullable=False)
+    user_id: str = Column(UUIDType, ForeignKey('users.id'), nullable=False)
+    quiz_id: str = Column(UUIDType, ForeignKey('quizzes.id'), nullable=False)
 
     # Fields related to the result
-    score: float = Column(Float, nullable=False, default=0.00)
-    # score: Decimal = Column(DECIMAL(5, 2), nullable=False, default=Decimal('0.00'))
+    # Score percentage stored in hundredths (0-10000); use the `score` property
+    _score: int = Column('score', SmallInteger, nullable=False, default=0)
     time_taken: int = Column(Integer, nullable=False, default=0)  # Initially set to 0
     status: str = Column(Enum(QuizSessionStatus), nullable=False, default=QuizSessionStatus.IN_PROGRESS)  # Enum for status
-    submitted_at: datetime = Column(DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))  # Standardized timestamp
-    start_time: datetime = Column(DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))  # Start time
-    end_time: datetime = Column(DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))  # End time for quiz session
+    # Timestamps default to the database clock when not supplied; loaded
+    # values are timezone-aware UTC (see UTCDateTime)
+    submitted_at: datetime = Column(UTCDateTime, nullable=True, server_default=func.now())  # Standardized timestamp
+    start_time: datetime = Column(UTCDateTime, nullable=True, server_default=func.now())  # Start time
+    end_time: datetime = Column(UTCDateTime, nullable=True, server_default=func.now())  # End time for quiz session
 
     # Relationships to link to User and Quiz tables
-    user = relationship('User', back_populates='results')
-    quiz = relationship('Quiz', back_populates='results')
+    # Many-to-one links raise on lazy access; use selectinload() or fetch
+    # the parent by its id
+    user = relationship('User', back_populates='results', lazy='raise')
+    quiz = relationship('Quiz', back_populates='results', lazy='raise')
     user_answers = relationship('UserAnswer', back_populates='result', cascade="all, delete-orphan")
 
-    # Composite index for user_id and quiz_id
+    # Composite index for user_id, quiz_id and start_time; its
+    # (user_id, quiz_id) prefix also serves plain per-user/quiz lookups
     __table_args__ = (
-        Index('idx_user_quiz', 'user_id', 'quiz_id'),
+        Index('idx_user_quiz_start', 'user_id', 'quiz_id', 'start_time'),
     )
 
     def __init__(self, *args: tuple, **kwargs: dict) -> None:
@@ -85,6 +97,32 @@ class Result(BaseModel, Base):
         """
         super().__init__(*args, **kwargs)
 
+    @hybrid_property
+    def score(self) -> Optional[float]:
+        """
+        Returns the score as a percentage with two decimal places.
+        """
+        if self._score is None:
+            return None
+        return self._score / 100.0
+
+    @score.setter
+    def score(self, value: Optional[float]) -> None:
+        """
+        Stores the score in hundredths of a percent.
+
+        Args:
+            value (float): The score percentage (0.00 - 100.00).
+        """
+        self._score = None if value is None else round(float(value) * 100)
+
+    @score.expression
+    def score(cls):
+        """
+        SQL expression for the score percentage.
+        """
+        return cls._score / 100.0
+
     @classmethod
     def get_attempt_number(cls, storage, user_id: str, quiz_id: str, filter_by_date: bool = False) -> int:
         """
@@ -99,17 +137,75 @@ class Result(BaseModel, Base):
         Returns:
             int: The number of attempts the user has made for the quiz.
         """
-        # Fetch all results for the user and quiz
-        results = storage.filter_by(cls, user_id=user_id, quiz_id=quiz_id)
+        # Let the database count the attempts instead of loading the rows
+        query = storage.query(func.count(cls.id)).filter(
+            cls.user_id == user_id, cls.quiz_id == quiz_id
+        )
 
         if filter_by_date:
-            # Get today's date (UTC)
-            today_date = datetime.now(timezone.utc).date()
-            # Filter manually for today's attempts
-            results = [result for result in results if result.start_time.date() == today_date]
+            # Half-open range over today (UTC) keeps the predicate sargable
+            start_of_day = datetime.combine(
+                datetime.now(timezone.utc).date(), time.min
+            )
+            query = query.filter(
+                cls.start_time >= start_of_day,
+                cls.start_time < start_of_day + timedelta(days=1)
+            )
 
-        # Return the count of filtered results
-        return len(results)
+        return query.scalar() or 0
+
+    @classmethod
+    def list_dicts(cls, storage, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Returns results as JSON-ready dictionaries without loading ORM
+        objects, newest first.
+
+        Only plain column values are selected, so rows skip identity-map
+        and attribute instrumentation. The dictionaries have the same shape
+        as Result.to_json().
+
+        Args:
+            storage (Storage): The storage instance to interact with the database.
+            **filters: Column-value pairs to filter by (e.g. user_id=...).
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per matching result.
+        """
+        # Label every column with its to_json() key so the row keys don't
+        # depend on how the attribute and column names are resolved
+        columns = [getattr(cls, key).label(key)
+                   for key in cls.__mapper__.columns.keys() if key != "_score"]
+        columns.append(cls._score.label("score"))
+        stmt = select(*columns).select_from(cls).filter_by(
+            **filters
+        ).order_by(cls.created_at.desc())
+
+        results = []
+        for row in storage.execute(stmt):
+            data = {}
+            for key, value in row._mapping.items():
+                if key == "score":
+                    value = value / 100.0
+                if key == "time_taken":
+                    key = "time_taken (in seconds)"
+                if isinstance(value, datetime):
+                    value = value.strftime(time_format)
+                elif isinstance(value, PyEnum):
+                    value = value.value
+                data[key] = value
+            results.append(data)
+        return results
+
+    def to_json(self, for_serialization: bool = False) -> dict:
+        """
+        Convert the object to a JSON dictionary, exposing the stored
+        hundredths as the `score` percentage.
+        """
+        result = super().to_json(for_serialization)
+        result.pop("_score", None)
+        if "_score" in self.__dict__:
+            result["score"] = self.score
+        return result
 
     def __str__(self) -> str:
         """
@@ -4,10 +4,10 @@ Holds the class Topic, representing a topic in the system.
 This class interacts with the database via SQLAlchemy for data persistence.
 """
 
-from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, ForeignKey
-from sqlalchemy.orm import relationship
-from typing import Optional
+from models.base_model import BaseModel, Base, UUIDType
+from sqlalchemy import Column, String, ForeignKey, select
+from sqlalchemy.orm import relationship, backref, aliased
+from typing import List, Optional
 
 
 class Topic(BaseModel, Base):
@@ -27,16 +27,19 @@ class Topic(BaseModel, Base):
 
     # Column for the parent topic ID to establish hierarchy (nullable to allow top-level topics)
     parent_id: Optional[str] = Column(
-        String(60), 
+        UUIDType,
         ForeignKey('topics.id', ondelete='CASCADE'), 
         nullable=True,
-        default=None
+        default=None,
+        index=True
     )
 
     # Relationship to self to represent parent-child relationship
     # parent = relationship('Topic', remote_side=[Topic.id], backref='subtopics')
     # parent = relationship('Topic', remote_side=['id'], backref='subtopics')
-    parent = relationship('Topic', remote_side=lambda: [Topic.id], backref='subtopics')
+    # Subtopics raise on lazy access; walk the tree with descendants()
+    parent = relationship('Topic', remote_side=lambda: [Topic.id],
+                          backref=backref('subtopics', lazy='raise'))
 
     # Relationship with the Quiz table
     quizzes = relationship('Quiz', back_populates='topic', passive_deletes=True)
@@ -48,6 +51,31 @@ class Topic(BaseModel, Base):
         """
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def descendants(cls, storage, root_id: str) -> List['Topic']:
+        """
+        Returns a topic together with its whole subtree in one query.
+
+        The subtree is collected by a recursive CTE, so the cost is a
+        single round trip no matter how deep the hierarchy is. Requires a
+        database with WITH RECURSIVE support (MySQL 8+, PostgreSQL, SQLite).
+
+        Args:
+            storage (Storage): The storage instance to interact with the database.
+            root_id (str): The ID of the topic at the root of the subtree.
+
+        Returns:
+            List[Topic]: The root topic followed by all of its descendants.
+        """
+        tree = select(cls).where(cls.id == root_id).cte(
+            'topic_tree', recursive=True
+        )
+        child = aliased(cls)
+        tree = tree.union_all(
+            select(child).where(child.parent_id == tree.c.id)
+        )
+        return storage.query(aliased(cls, tree)).all()
+
     def __str__(self) -> str:
         """
         Returns a string representation of the Topic instance.
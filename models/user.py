@@ -5,16 +5,45 @@ This class includes methods for password encryption and password
 validation. It interacts with the database via SQLAlchemy for data persistence.
 """
 
-from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, Enum, DateTime  # Import Enum
+from models.base_model import BaseModel, Base, UTCDateTime
+from sqlalchemy import Column, String, LargeBinary, SmallInteger
+from sqlalchemy import DDL, event, func
+from sqlalchemy.types import TypeDecorator, UserDefinedType
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
-from bcrypt import gensalt, hashpw, checkpw
+from sqlalchemy.ext.hybrid import hybrid_property
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHash, VerificationError
+from bcrypt import checkpw
 from datetime import datetime, timezone, timedelta
+import hashlib
+import os
 import secrets
 from typing import Optional
 import enum
 
 
+# Argon2id hasher for new passwords; cost parameters can be lowered for
+# tests and seeding scripts. bcrypt is only kept to verify legacy hashes.
+_ph = PasswordHasher(
+    time_cost=int(os.getenv('ARGON2_TIME_COST', '3')),
+    memory_cost=int(os.getenv('ARGON2_MEMORY_COST', str(64 * 1024))),
+    parallelism=int(os.getenv('ARGON2_PARALLELISM', '2'))
+)
+
+def _hash_password(raw_password: str) -> str:
+    """
+    Hashes a raw password with Argon2id.
+
+    Args:
+        raw_password (str): The plain-text password.
+
+    Returns:
+        str: The encoded Argon2id hash.
+    """
+    return _ph.hash(raw_password)
+
+
 class Role(enum.Enum):
     """
     Enum for User roles. It defines the possible roles in the system.
@@ -33,10 +62,54 @@ class Role(enum.Enum):
         Returns:
             Role: Corresponding Role enum member.
         """
-        for role in cls:
-            if role.value == role_str.lower():
-                return role
-        raise ValueError(f"Invalid role: {role_str}. Must be one of {[r.value for r in cls]}")
+        role = cls._value_index.get(role_str.lower())
+        if role is None:
+            raise ValueError(f"Invalid role: {role_str}. Must be one of {[r.value for r in cls]}")
+        return role
+
+
+# Value -> member lookup table shared by every Role.from_str call
+Role._value_index = {member.value: member for member in Role}
+
+
+class CIText(UserDefinedType):
+    """
+    PostgreSQL CITEXT (case-insensitive text) column type.
+
+    SQLAlchemy 1.4 does not ship a CITEXT type, so it is declared here and
+    only used as the PostgreSQL variant of the email/username columns.
+    """
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        """Returns the DDL type name."""
+        return "CITEXT"
+
+
+class RoleType(TypeDecorator):
+    """
+    Stores a Role as a small integer code instead of an ENUM/VARCHAR,
+    keeping the indexed role column narrow and comparisons cheap.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    _codes = {Role.USER: 0, Role.ADMIN: 1}
+    _roles = {code: role for role, code in _codes.items()}
+
+    def process_bind_param(self, value: Optional[Role],
+                           dialect) -> Optional[int]:
+        """Converts a Role to its integer code."""
+        if value is None:
+            return None
+        return self._codes[value]
+
+    def process_result_value(self, value: Optional[int],
+                             dialect) -> Optional[Role]:
+        """Converts an integer code back to a Role."""
+        if value is None:
+            return None
+        return self._roles[value]
 
 
 class User(BaseModel, Base):
@@ -57,18 +130,27 @@ class User(BaseModel, Base):
 
     first_name: str = Column(String(128), nullable=False)
     last_name: str = Column(String(128), nullable=False)
-    username: str = Column(String(128), unique=True, nullable=False, index=True)
-    email: str = Column(String(128), unique=True, nullable=False, index=True)
-    password: str = Column(String(128), nullable=False)
-    role: Role = Column(Enum(Role), default=Role.USER, nullable=False, index=True)
-    reset_token: Optional[str] = Column(String(128), unique=True, nullable=True)
-    token_expiry: Optional[datetime] = Column(DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))
+    # Case-insensitive on PostgreSQL via CITEXT so the plain unique index
+    # serves lookups; MySQL's default *_ci collation already compares so
+    username: str = Column(String(128).with_variant(CIText(), 'postgresql'), unique=True, nullable=False, index=True)
+    email: str = Column(String(128).with_variant(CIText(), 'postgresql'), unique=True, nullable=False, index=True)
+    # Stored hash; assign through the `password` property below
+    _password: str = Column('password', String(128), nullable=False)
+    role: Role = Column(RoleType, default=Role.USER, nullable=False, index=True)
+    # SHA-256 digest of the outstanding reset token; the raw token is only
+    # ever sent to the user. Fixed-width BINARY(32) on MySQL so it can be indexed.
+    reset_token_hash: Optional[bytes] = Column(
+        LargeBinary(32).with_variant(mysql.BINARY(32), 'mysql'),
+        unique=True, nullable=True, index=True
+    )
+    token_expiry: Optional[datetime] = Column(UTCDateTime, nullable=True, server_default=func.now())
 
-    # One-to-many relationships with cascade delete
-    results: list = relationship('Result', back_populates='user', cascade="all, delete-orphan")
-    user_answers: list = relationship('UserAnswer', back_populates='user', cascade="all, delete-orphan")
-    # Update the User model to include the relationship
-    refresh_tokens = relationship('RefreshToken', back_populates='user', cascade="all, delete-orphan")
+    # One-to-many relationships with cascade delete. Results and answers
+    # raise on lazy access; load them explicitly with selectinload().
+    results: list = relationship('Result', back_populates='user', cascade="all, delete-orphan", lazy='raise')
+    user_answers: list = relationship('UserAnswer', back_populates='user', cascade="all, delete-orphan", lazy='raise')
+    # Refresh tokens are batch-loaded with the user (one extra IN query)
+    refresh_tokens = relationship('RefreshToken', back_populates='user', cascade="all, delete-orphan", lazy='selectin')
 
 
     def __init__(self, *args: tuple, **kwargs: dict) -> None:
@@ -78,24 +160,27 @@ class User(BaseModel, Base):
         """
         super().__init__(*args, **kwargs)
 
-    def __setattr__(self, name: str, value: str) -> None:
+    @hybrid_property
+    def password(self) -> str:
+        """
+        Returns the user's stored (hashed) password.
+        """
+        return self._password
+
+    @password.setter
+    def password(self, value: str) -> None:
         """
         Encrypts the password when setting the 'password' attribute.
-        The password is hashed using bcrypt with a salt for secure storage.
+        The password is hashed using Argon2id for secure storage.
+
+        Rows loaded from the database populate `_password` directly, so
+        hashing only runs when user code assigns a password. Every value
+        assigned here is hashed, including ones that look like hashes.
 
         Args:
-            name (str): The name of the attribute being set.
-            value (str): The value being assigned to the attribute.
+            value (str): The raw password.
         """
-        if name == "password":
-            # Check if the value is already hashed
-            if not value.startswith("$2b$"):
-                # Encrypt the password using bcrypt
-                salt = gensalt()
-                value = hashpw(value.encode('utf-8'), salt).decode('utf-8')
-
-        # Call the parent class's __setattr__ method to store the value
-        super().__setattr__(name, value)
+        self._password = _hash_password(value)
 
     def check_password(self, password: str) -> bool:
         """
@@ -108,13 +193,34 @@ class User(BaseModel, Base):
             bool: True if the password matches the stored hash,
                   False otherwise.
         """
-        if self.password:
+        if not self.password:
+            return False
+        if self.password.startswith("$2b$"):
+            # Legacy bcrypt hash
             return checkpw(password.encode('utf-8'), self.password.encode('utf-8'))
-        return False
+        try:
+            return _ph.verify(self.password, password)
+        except (VerificationError, InvalidHash):
+            return False
+
+    def needs_rehash(self) -> bool:
+        """
+        Checks whether the stored hash should be replaced, either because
+        it is a legacy bcrypt hash or because the Argon2 parameters changed.
+
+        Call after a successful check_password() and, if True, store the
+        raw password again with set_password() to migrate the hash.
+
+        Returns:
+            bool: True if the password should be re-hashed.
+        """
+        if not self.password or self.password.startswith("$2b$"):
+            return True
+        return _ph.check_needs_rehash(self.password)
 
     def set_password(self, raw_password: str) -> None:
         """
-        Sets and encrypts the user's password using bcrypt.
+        Sets and encrypts the user's password using Argon2id.
 
         Args:
             raw_password (str): The raw password to be set for the user.
@@ -124,12 +230,51 @@ class User(BaseModel, Base):
         self.password = raw_password  # Set the new password
         self.save()  # Save the user with the updated password
 
-    def generate_reset_token(self) -> None:
+    @staticmethod
+    def hash_reset_token(token: str) -> bytes:
+        """
+        Hashes a raw password reset token for storage or lookup.
+
+        Args:
+            token (str): The raw reset token.
+
+        Returns:
+            bytes: The 32-byte SHA-256 digest of the token.
+        """
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def generate_reset_token(self) -> str:
         """
         Generates a password reset token and sets its expiration.
 
-        The token is a secure random string and expires in 1 hour.
+        The token is a 128-bit random value encoded as 32 hex characters
+        and expires in 1 hour. Only its SHA-256 digest is stored.
+
+        Returns:
+            str: The raw token, to be sent to the user.
         """
-        self.reset_token = secrets.token_urlsafe(64)
+        token = secrets.token_hex(16)
+        self.reset_token_hash = self.hash_reset_token(token)
         self.token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)  # Token valid for 1 hour
         self.save()  # Save to the database
+        return token
+
+
+# The CITEXT type lives in a PostgreSQL extension that must exist before the
+# users table is created
+event.listen(
+    User.__table__,
+    'before_create',
+    DDL("CREATE EXTENSION IF NOT EXISTS citext")
+    .execute_if(dialect='postgresql')
+)
+
+# Admins are a tiny fraction of users, so on PostgreSQL admin listings use a
+# partial index holding only admin rows (role code 1, see RoleType). MySQL
+# has no partial indexes and keeps using the full index on role.
+event.listen(
+    User.__table__,
+    'after_create',
+    DDL("CREATE INDEX ix_users_admin ON users (id) WHERE role = 1")
+    .execute_if(dialect='postgresql')
+)
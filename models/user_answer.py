@@ -4,10 +4,12 @@ Holds the class UserAnswer, representing a user's answer to a question.
 This class interacts with the database via SQLAlchemy for data persistence.
 """
 
-from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, ForeignKey, Index
+from models.base_model import BaseModel, Base, UUIDType
+from sqlalchemy import Column, ForeignKey, Index, event, insert, lambda_stmt, select
 from sqlalchemy.orm import relationship
-from typing import Optional
+from datetime import datetime, timezone
+import uuid
+from typing import Any, Dict, List, Optional
 
 
 class UserAnswer(BaseModel, Base):
@@ -25,22 +27,31 @@ class UserAnswer(BaseModel, Base):
 
     __tablename__ = 'user_answers'
 
-    user_id: str = Column(String(60), ForeignKey('users.id'), nullable=False)
-    quiz_id: str = Column(String(60), ForeignKey('quizzes.id'), nullable=False)
-    question_id: str = Column(String(60), ForeignKey('questions.id'), nullable=False)
-    choice_id: str = Column(String(60), ForeignKey('choices.id'), nullable=False, index=True)
-    result_id: str = Column(String(60), ForeignKey('results.id'), nullable=False)  # Reference to the quiz attempt (Result)
+    user_id: str = Column(UUIDType, ForeignKey('users.id'), nullable=False)
+    quiz_id: str = Column(UUIDType, ForeignKey('quizzes.id'), nullable=False)
+    question_id: str = Column(UUIDType, ForeignKey('questions.id'), nullable=False)
+    choice_id: str = Column(UUIDType, ForeignKey('choices.id'), nullable=False, index=True)
+    result_id: str = Column(UUIDType, ForeignKey('results.id'), nullable=False)  # Reference to the quiz attempt (Result)
 
 
     # Relationships with other tables
-    user = relationship('User', back_populates='user_answers')
-    quiz = relationship('Quiz', back_populates='user_answers')
-    question = relationship('Question', back_populates='user_answers')
-    choice = relationship('Choice', back_populates='user_answers')
+    # question/choice are batch-loaded with one IN (...) query per result
+    # set; user/quiz are rarely walked from an answer, so they raise on
+    # lazy access (use the *_id columns or fetch the parent by id)
+    user = relationship('User', back_populates='user_answers', lazy='raise')
+    quiz = relationship('Quiz', back_populates='user_answers', lazy='raise')
+    question = relationship('Question', back_populates='user_answers', lazy='selectin')
+    choice = relationship('Choice', back_populates='user_answers', lazy='selectin')
     result = relationship('Result', back_populates='user_answers')  # Linking to the Result table
 
     __table_args__ = (
-        Index('idx_result_user_quiz_question', 'result_id', 'user_id', 'quiz_id', 'question_id'),
+        # Covering on PostgreSQL: the chosen answer is read from the index
+        Index('idx_result_user_quiz_question', 'result_id', 'user_id', 'quiz_id', 'question_id',
+              postgresql_include=['choice_id']),
+        # Per-question aggregations (correct-rate stats, leaderboards)
+        Index('idx_quiz_question', 'quiz_id', 'question_id'),
+        # A user's recent answer activity
+        Index('idx_user_created', 'user_id', 'created_at'),
     )
 
 
@@ -51,12 +62,101 @@ class UserAnswer(BaseModel, Base):
         """
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def bulk_create(cls, storage, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Inserts many user answers with a single Core INSERT.
+
+        The rows bypass the ORM unit of work (no instances, identity map or
+        autoflush), so a whole quiz submission is one executemany round
+        trip. Missing `id`, `created_at` and `updated_at` values are filled
+        in place, so the returned rows match what was written. The caller
+        still commits via storage.save().
+
+        Args:
+            storage (Storage): The storage instance to interact with the database.
+            rows (List[Dict[str, Any]]): Column-value mappings, one per answer.
+
+        Returns:
+            List[Dict[str, Any]]: The inserted rows.
+        """
+        if not rows:
+            return rows
+
+        now = datetime.now(timezone.utc)
+        for row in rows:
+            row.setdefault('id', str(uuid.uuid4()))
+            row.setdefault('created_at', now)
+            row.setdefault('updated_at', now)
+
+        storage.execute(_INSERT_STMT, rows)
+        return rows
+
+    @classmethod
+    def get_user_answers(cls, storage, user_id: str,
+                         quiz_id: Optional[str] = None,
+                         result_id: Optional[str] = None) -> List['UserAnswer']:
+        """
+        Fetches a user's answers, newest first, optionally narrowed to one
+        quiz and/or one result (attempt).
+
+        The statement is built with lambda_stmt, so each filter combination
+        is compiled once and later calls only bind new parameter values.
+
+        Args:
+            storage (Storage): The storage instance to interact with the database.
+            user_id (str): The ID of the user.
+            quiz_id (str, optional): Restrict answers to this quiz.
+            result_id (str, optional): Restrict answers to this result.
+
+        Returns:
+            List[UserAnswer]: The matching answers ordered by creation date.
+        """
+        stmt = lambda_stmt(
+            lambda: select(UserAnswer).where(UserAnswer.user_id == user_id)
+        )
+        if quiz_id:
+            stmt += lambda s: s.where(UserAnswer.quiz_id == quiz_id)
+        if result_id:
+            stmt += lambda s: s.where(UserAnswer.result_id == result_id)
+        stmt += lambda s: s.order_by(UserAnswer.created_at.desc())
+        return storage.execute(stmt).scalars().all()
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the UserAnswer instance.
 
+        The string is built on first use and cached on the instance; it is
+        dropped whenever one of the IDs it shows changes (see the
+        listeners below).
+
         Returns:
             str: A detailed string representation of the instance.
         """
-        return (f"UserAnswer(user_id={self.user_id}, quiz_id={self.quiz_id}, "
-                f"question_id={self.question_id}, choice_id={self.choice_id})")
+        cached = self.__dict__.get('_repr_cache')
+        if cached is None:
+            cached = self._repr_cache = (
+                f"UserAnswer(user_id={self.user_id}, quiz_id={self.quiz_id}, "
+                f"question_id={self.question_id}, choice_id={self.choice_id})"
+            )
+        return cached
+
+
+# Built once at import; bulk_create reuses it for every submission
+_INSERT_STMT = insert(UserAnswer.__table__)
+
+
+def _drop_repr_cache(target, *args) -> None:
+    """
+    Forgets the cached __repr__ string of a UserAnswer.
+    """
+    target.__dict__.pop('_repr_cache', None)
+
+
+# The cached repr shows these columns; any change (or reload) invalidates it
+for _attr in (UserAnswer.user_id, UserAnswer.quiz_id,
+              UserAnswer.question_id, UserAnswer.choice_id):
+    event.listen(_attr, 'set', _drop_repr_cache)
+del _attr
+event.listen(UserAnswer, 'refresh', _drop_repr_cache)
+event.listen(UserAnswer, 'expire', _drop_repr_cache)
@@ -1,5 +1,15 @@
 #!/usr/bin/env python3
-"""Generates and outputs generated secret key"""
-import secrets
-secret_key = secrets.token_hex(32)  # 32-byte secret key
-print(secret_key)
+"""Generates and outputs generated secret key
+
+Usage: ./secret_key_generator.py [count]   (prints one key per line)
+"""
+import binascii
+import os
+import sys
+
+KEY_BYTES = 32  # 32-byte secret key
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+# One urandom() call for all keys, sliced per key
+pool = os.urandom(KEY_BYTES * count)
+for start in range(0, len(pool), KEY_BYTES):
+    print(binascii.hexlify(pool[start:start + KEY_BYTES]).decode())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the QuizyPal test suite.
+
+This module is loaded by pytest before any test module is imported, so
+environment settings made here are visible when the models package is
+first imported.
+"""
+import os
+from collections import Counter
+import pytest
+from argon2.exceptions import VerifyMismatchError
+
+# Password hashing is stubbed for the whole run (see
+# _stub_password_hasher); tests that opt back in to the real hasher still
+# get cheap Argon2id parameters.
+# Production keeps the defaults (time_cost=3, memory_cost=64 MiB).
+os.environ.setdefault('ARGON2_TIME_COST', '1')
+os.environ.setdefault('ARGON2_MEMORY_COST', '8')
+os.environ.setdefault('ARGON2_PARALLELISM', '1')
+
+# Unit tests mock every database access; skip engine and table setup.
+# Tests that exercise DBStorage itself build their own instances.
+# models refuses QUIZYPAL_NO_DB outside FLASK_ENV=test.
+os.environ.setdefault('FLASK_ENV', 'test')
+os.environ.setdefault('QUIZYPAL_NO_DB', '1')
+
+# Views cached with Flask-Caching run uncached unless a test opts in,
+# so the suite needs no Redis server.
+os.environ.setdefault('CACHE_TYPE', 'NullCache')
+
+
+def pytest_collection_finish(session):
+    """
+    Fail the run if two collected test modules share a file name.
+
+    Duplicate copies of a module (merge leftovers, case-only renames) run
+    the same assertions twice; catch them at collection time.
+    """
+    modules = {item.fspath for item in session.items}
+    names = Counter(os.path.basename(str(path)).lower() for path in modules)
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    if duplicates:
+        raise pytest.UsageError(
+            "Duplicate test modules collected: " + ", ".join(duplicates)
+        )
+
+
+class _StubHasher:
+    """
+    Stand-in for the Argon2 hasher in models.user that does no key
+    derivation. Its hashes keep the '$argon2' prefix, so check_password()
+    sends them to this hasher rather than bcrypt, and verify() accepts
+    exactly the passwords hash() produced them from.
+    """
+    prefix = "$argon2id$stub$"
+
+    def hash(self, password):
+        """Returns a fake hash of the password."""
+        return self.prefix + password
+
+    def verify(self, hash, password):
+        """Raises VerifyMismatchError unless the password matches."""
+        if hash != self.prefix + password:
+            raise VerifyMismatchError()
+        return True
+
+    def check_needs_rehash(self, hash):
+        """Stub hashes never need re-hashing."""
+        return False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_password_hasher():
+    """
+    Swap models.user's Argon2 hasher for _StubHasher for the whole
+    session, so a password assignment anywhere in the suite costs
+    nothing. Yields the real hasher; see real_hasher to opt out.
+    """
+    import models.user
+    real = models.user._ph
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(models.user, "_ph", _StubHasher())
+    yield real
+    patcher.undo()
+
+
+@pytest.fixture
+def real_hasher(monkeypatch, _stub_password_hasher):
+    """
+    Restores the real Argon2 hasher for one test. Opt in with
+    @pytest.mark.usefixtures("real_hasher").
+    """
+    import models.user
+    monkeypatch.setattr(models.user, "_ph", _stub_password_hasher)
+    return _stub_password_hasher
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_models():
+    """
+    Import every model and configure the mappers once per worker.
+
+    SQLAlchemy configures mappers lazily on first instantiation, which
+    would otherwise be charged to whichever test happens to run first.
+    """
+    import models.engine.db_storage  # noqa: F401  (imports all models)
+    from sqlalchemy.orm import configure_mappers
+    configure_mappers()
+
+
+@pytest.fixture(scope="session")
+def storage_singleton():
+    """
+    The process-wide models.storage object, imported once per worker.
+
+    Under the settings above this is a NullStorage, so tests that only
+    pass storage through to a model method need no database.
+    """
+    from models import storage
+    return storage
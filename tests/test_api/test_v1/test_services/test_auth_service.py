@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the rate_limited decorator in api.v1.services.auth_service.
+
+The Redis script is swapped for a stub, so the tests need no Redis
+server. They check that requests under the limit pass, that requests
+over it get a 429, that the counter is keyed per route and client IP
+with the window as its expiry, and that a Redis failure lets the
+request through.
+"""
+import unittest
+from unittest.mock import MagicMock
+from flask import Flask, jsonify
+from redis.exceptions import ConnectionError as RedisConnectionError
+from api.v1.services import auth_service
+from api.v1.services.auth_service import rate_limited
+
+
+class TestRateLimited(unittest.TestCase):
+    """
+    Test cases for the rate_limited decorator.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build an app with one route allowing 2 requests per 60 seconds.
+        """
+        cls.app = Flask(__name__)
+
+        @cls.app.route('/limited', methods=['POST'])
+        @rate_limited(2, 60, 'test')
+        def limited():
+            """Always succeeds when let through."""
+            return jsonify({"ok": True})
+
+        cls.client = cls.app.test_client()
+
+    def setUp(self):
+        """
+        Swap the Redis script for a stub returning the attempt count.
+        """
+        self._orig_script = auth_service._INCR_WITH_EXPIRY
+        self.script = MagicMock()
+        auth_service._INCR_WITH_EXPIRY = self.script
+
+    def tearDown(self):
+        """
+        Restore the real Redis script.
+        """
+        auth_service._INCR_WITH_EXPIRY = self._orig_script
+
+    def test_under_limit(self):
+        """
+        Test that a request within the limit reaches the view, and that
+        the counter is keyed per client IP with the window as its expiry.
+        """
+        self.script.return_value = 2
+        response = self.client.post('/limited',
+                                    environ_base={'REMOTE_ADDR': '10.0.0.1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.script.assert_called_once_with(keys=['test:10.0.0.1'],
+                                            args=[60])
+
+    def test_over_limit(self):
+        """
+        Test that a request past the limit is refused with a 429.
+        """
+        self.script.return_value = 3
+        response = self.client.post('/limited')
+
+        self.assertEqual(response.status_code, 429)
+
+    def test_redis_down_fails_open(self):
+        """
+        Test that a Redis error lets the request through.
+        """
+        self.script.side_effect = RedisConnectionError()
+        response = self.client.post('/limited')
+
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
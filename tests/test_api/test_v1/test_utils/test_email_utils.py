@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for email_validation_error in api.v1.utils.email_utils.
+
+The tests check that syntax errors are reported without any DNS work,
+and that only deliverable domains are read from and written to the
+shared cache.
+"""
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from email_validator import EmailUndeliverableError
+from api.v1.utils import email_utils
+from api.v1.utils.email_utils import email_validation_error
+
+
+class TestEmailValidationError(unittest.TestCase):
+    """
+    Test cases for the cached email validation helper.
+    """
+
+    def setUp(self):
+        """
+        Clear the syntax memo and stub the shared cache and DNS check.
+        """
+        email_utils._check_email_syntax.cache_clear()
+        cache_patcher = patch.object(email_utils, 'shared_cache')
+        self.shared_cache = cache_patcher.start()
+        self.shared_cache.get.return_value = None
+        self.addCleanup(cache_patcher.stop)
+
+    def test_invalid_syntax(self):
+        """
+        Test that malformed addresses fail before any deliverability check.
+        """
+        self.assertIsNotNone(email_validation_error("not-an-email"))
+        self.shared_cache.get.assert_not_called()
+
+    def test_cached_deliverable_domain(self):
+        """
+        Test that a cached deliverable domain skips the DNS lookup.
+        """
+        self.shared_cache.get.return_value = True
+        with patch.object(email_utils, 'validate_email',
+                          wraps=email_utils.validate_email) as mock_validate:
+            self.assertIsNone(email_validation_error("user@example.com"))
+        # Only the syntax-only call ran
+        mock_validate.assert_called_once_with("user@example.com",
+                                              check_deliverability=False)
+
+    def test_deliverable_domain_is_cached(self):
+        """
+        Test that a domain passing the deliverability check is shared.
+        """
+        def fake_validate(email, check_deliverability=True):
+            return SimpleNamespace(domain=email.rsplit("@", 1)[1])
+
+        with patch.object(email_utils, 'validate_email',
+                          side_effect=fake_validate):
+            self.assertIsNone(email_validation_error("user@example.com"))
+
+        self.shared_cache.set.assert_called_once_with(
+            "email_deliverability:example.com", True,
+            email_utils.DELIVERABILITY_TTL
+        )
+
+    def test_undeliverable_domain_not_cached(self):
+        """
+        Test that a failed deliverability check is reported but not
+        shared, since it may come from a transient DNS failure.
+        """
+        def fake_validate(email, check_deliverability=True):
+            if check_deliverability:
+                raise EmailUndeliverableError("The domain does not exist.")
+            return SimpleNamespace(domain=email.rsplit("@", 1)[1])
+
+        with patch.object(email_utils, 'validate_email',
+                          side_effect=fake_validate):
+            error = email_validation_error("user@nowhere.invalid")
+
+        self.assertEqual(error, "The domain does not exist.")
+        self.shared_cache.set.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the verified JWT cache in api.v1.utils.token_utils.
+
+The tests check that a token goes through JWTManager's full decode only
+once while it is cached (one full decode calls jwt.decode more than
+once, so the full decode itself is counted), that evicted tokens are
+verified again, and that expired tokens are never served from the cache.
+"""
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token, decode_token
+from jwt import ExpiredSignatureError
+from api.v1.utils.token_utils import (
+    CachedJWTManager, clear_token_cache, evict_token
+)
+
+
+class TestCachedJWTManager(unittest.TestCase):
+    """
+    Test cases for CachedJWTManager and evict_token.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up a minimal Flask app using the cached JWT manager.
+        """
+        cls.app = Flask(__name__)
+        cls.app.config['JWT_SECRET_KEY'] = 'supersecretkey'
+        CachedJWTManager(cls.app)
+
+    def setUp(self):
+        """
+        Start every test with an empty cache.
+        """
+        clear_token_cache()
+
+    @staticmethod
+    def _count_full_decodes():
+        """
+        Wraps the uncached JWTManager decode so tests can count how often
+        a token is fully verified.
+        """
+        return patch.object(JWTManager, '_decode_jwt_from_config',
+                            autospec=True,
+                            side_effect=JWTManager._decode_jwt_from_config)
+
+    def test_repeat_decode_skips_verification(self):
+        """
+        Test that a cached token is not verified again.
+        """
+        with self.app.app_context():
+            token = create_access_token(identity='user123')
+            with self._count_full_decodes() as mock_decode:
+                first = decode_token(token)
+                second = decode_token(token)
+
+        self.assertEqual(mock_decode.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second['sub'], 'user123')
+
+    def test_evicted_token_is_verified_again(self):
+        """
+        Test that evict_token forces a full decode on the next use.
+        """
+        with self.app.app_context():
+            token = create_access_token(identity='user123')
+            with self._count_full_decodes() as mock_decode:
+                decode_token(token)
+                evict_token(token)
+                decode_token(token)
+
+        self.assertEqual(mock_decode.call_count, 2)
+
+    def test_expired_token_not_served(self):
+        """
+        Test that expired tokens still raise instead of hitting the cache.
+        """
+        with self.app.app_context():
+            token = create_access_token(identity='user123',
+                                        expires_delta=timedelta(seconds=-1))
+            with self.assertRaises(ExpiredSignatureError):
+                decode_token(token)
+
+
+if __name__ == "__main__":
+    unittest.main()
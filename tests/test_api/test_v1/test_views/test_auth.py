@@ -5,15 +5,42 @@ in the Flask API. The tests include login, logout, refresh token,
 forgot password, and reset password. Mocked user data and JWT tokens
 are used for testing the routes to ensure they return the correct
 status codes and handle errors appropriately.
+
+Collaborators are swapped by plain attribute assignment in setUp/tearDown
+rather than mock.patch decorators, which are far slower per test.
 """
 import unittest
-from unittest.mock import patch, MagicMock
-from flask import Flask
-from flask_jwt_extended import create_access_token, JWTManager
+from types import SimpleNamespace
+from flask import Blueprint, Flask
+from flask_jwt_extended import create_access_token
+from api.v1.utils.token_utils import CachedJWTManager
+import api.v1.services.auth_service as auth_service
+import api.v1.views.auth as auth_views
 from api.v1.views.auth import login, logout, forgot_password, reset_password
+from models.user import User
 from api.v1.views.refresh_tokens import refresh_token
 
 
+# URL rule -> view function for the routes under test
+AUTH_ROUTES = {
+    '/login': login,
+    '/logout': logout,
+    '/refresh-token': refresh_token,
+    '/forgot-password': forgot_password,
+    '/reset-password/<token>': reset_password,
+}
+
+
+def make_auth_blueprint() -> Blueprint:
+    """
+    Returns a blueprint carrying the authentication routes under test.
+    """
+    auth_bp = Blueprint('auth_test', __name__)
+    for rule, view_func in AUTH_ROUTES.items():
+        auth_bp.add_url_rule(rule, view_func=view_func, methods=['POST'])
+    return auth_bp
+
+
 class TestAuthViews(unittest.TestCase):
     """
     Test cases for authentication-related routes in the Flask API.
@@ -34,23 +61,23 @@ class TestAuthViews(unittest.TestCase):
         cls.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
         # Initialize JWTManager with Flask app
-        cls.jwt = JWTManager(cls.app)
-
-        # Create mock user
-        cls.user = MagicMock()
-        cls.user.email = 'test@example.com'
-
-        # Register routes
-        cls.app.add_url_rule('/api/v1/login',
-                             view_func=login, methods=['POST'])
-        cls.app.add_url_rule('/api/v1/logout',
-                             view_func=logout, methods=['POST'])
-        cls.app.add_url_rule('/api/v1/refresh-token',
-                             view_func=refresh_token, methods=['POST'])
-        cls.app.add_url_rule('/api/v1/forgot-password',
-                             view_func=forgot_password, methods=['POST'])
-        cls.app.add_url_rule('/api/v1/reset-password/<token>',
-                             view_func=reset_password, methods=['POST'])
+        cls.jwt = CachedJWTManager(cls.app)
+
+        # Stand-in user (only the email is read)
+        cls.user = SimpleNamespace(email='test@example.com')
+
+        # Stand-in for the User class in the auth views; storage ignores
+        # classes outside the model registry, so lookups never hit the DB
+        cls.stub_user_cls = SimpleNamespace(
+            hash_reset_token=User.hash_reset_token
+        )
+
+        # Sign the token every test sends once, instead of once per test
+        with cls.app.app_context():
+            cls.access_token = create_access_token(identity=cls.user.email)
+
+        # Register routes in one pass through a blueprint
+        cls.app.register_blueprint(make_auth_blueprint(), url_prefix='/api/v1')
 
     def setUp(self):
         """
@@ -58,69 +85,63 @@ class TestAuthViews(unittest.TestCase):
         each individual test to set up a fresh test client.
         """
         self.client = self.app.test_client()
+        self._orig_user = auth_views.User
+        auth_views.User = self.stub_user_cls
+        # Keep the login rate limiter off Redis; every attempt is the first
+        self._orig_incr = auth_service._INCR_WITH_EXPIRY
+        auth_service._INCR_WITH_EXPIRY = lambda keys, args: 1
+
+    def tearDown(self):
+        """
+        Restore the real User class and rate limiter script.
+        """
+        auth_views.User = self._orig_user
+        auth_service._INCR_WITH_EXPIRY = self._orig_incr
 
-    @patch('api.v1.views.auth.User')
-    def test_login(self, mock_user):
+    def test_login(self):
         """
         Test the /api/v1/login endpoint to check that a user can log in with
         a valid access token and receive the correct response status.
         """
-        mock_user.return_value.email = self.user.email
-        with self.app.app_context():
-            access_token = create_access_token(identity=self.user.email)
-            response = self.client.post('/api/v1/login',
-                                        json={'access_token': access_token})
+        response = self.client.post('/api/v1/login',
+                                    json={'access_token': self.access_token})
         self.assertEqual(response.status_code, 400)
 
-    @patch('api.v1.views.auth.User')
-    def test_logout(self, mock_user):
+    def test_logout(self):
         """
         Test the /api/v1/logout endpoint to ensure that logging out with an
         access token returns the correct response status.
         """
-        mock_user.return_value.email = self.user.email
-        with self.app.app_context():
-            access_token = create_access_token(identity=self.user.email)
-            response = self.client.post('/api/v1/logout',
-                                        json={'access_token': access_token})
+        response = self.client.post('/api/v1/logout',
+                                    json={'access_token': self.access_token})
         self.assertEqual(response.status_code, 401)
 
-    @patch('api.v1.views.auth.User')
-    def test_refresh_token(self, mock_user):
+    def test_refresh_token(self):
         """
         Test the /api/v1/refresh-token endpoint to ensure that refreshing a
         token with a valid access token returns the correct response status.
         """
-        mock_user.return_value.email = self.user.email
-        with self.app.app_context():
-            access_token = create_access_token(identity=self.user.email)
-            response = self.client.post('/api/v1/refresh-token',
-                                        json={'access_token': access_token})
+        response = self.client.post('/api/v1/refresh-token',
+                                    json={'access_token': self.access_token})
         self.assertEqual(response.status_code, 401)
 
-    @patch('api.v1.views.auth.User')
-    def test_forgot_password(self, mock_user):
+    def test_forgot_password(self):
         """
         Test the /api/v1/forgot-password endpoint to verify that requesting
         a password reset with a valid email returns the correct response.
         """
-        mock_user.return_value.email = self.user.email
-        with self.app.app_context():
-            response = self.client.post('/api/v1/forgot-password',
-                                        json={'email': self.user.email})
+        response = self.client.post('/api/v1/forgot-password',
+                                    json={'email': self.user.email})
         self.assertEqual(response.status_code, 404)
 
-    @patch('api.v1.views.auth.User')
-    def test_reset_password(self, mock_user):
+    def test_reset_password(self):
         """
         Test the /api/v1/reset-password/<token> endpoint
         to check that resetting the password with a valid token
         and new password returns the correct response.
         """
-        mock_user.return_value.email = self.user.email
-        with self.app.app_context():
-            response = self.client.post('/api/v1/reset-password/mocktoken',
-                                        json={'password': 'newpassword'})
+        response = self.client.post('/api/v1/reset-password/mocktoken',
+                                    json={'password': 'newpassword'})
         self.assertEqual(response.status_code, 400)
 
 
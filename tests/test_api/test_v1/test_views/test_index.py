@@ -6,18 +6,29 @@ stats, and the home endpoint. The tests ensure the correct status codes and
 responses are returned for each route.
 """
 import unittest
+from unittest.mock import patch
 from flask import Flask
 from api.v1.views import app_views
+from api.v1.cache import invalidate_stats
+from config import cache
 
 
 class TestAppViews(unittest.TestCase):
     """Test cases for app_views endpoints."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the Flask app and its test client once for all tests."""
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(app_views, url_prefix='/api/v1')
+        # In-process cache, emptied before every test
+        cache.init_app(cls.app, config={'CACHE_TYPE': 'SimpleCache'})
+        cls.client = cls.app.test_client()
+
     def setUp(self):
-        """Set up a test client for the Flask app."""
-        self.app = Flask(__name__)
-        self.app.register_blueprint(app_views, url_prefix='/api/v1')
-        self.client = self.app.test_client()
+        """Start each test with an empty response cache."""
+        with self.app.app_context():
+            cache.clear()
 
     def test_status_endpoint(self):
         """Test the /api/v1/status endpoint."""
@@ -40,12 +51,24 @@ class TestAppViews(unittest.TestCase):
     def test_stats_endpoint(self):
         """Test the /api/v1/stats endpoint."""
         # Mocking the User.count method
-        from unittest.mock import patch
         with patch('models.storage.count', return_value=10):
             response = self.client.get('/api/v1/stats')
             self.assertEqual(response.status_code, 200)
             self.assertEqual(response.json, {"users": 10})
 
+    def test_stats_endpoint_cached(self):
+        """Test that /api/v1/stats is served from cache until invalidated."""
+        with patch('models.storage.count', return_value=10) as mock_count:
+            self.client.get('/api/v1/stats')
+            response = self.client.get('/api/v1/stats')
+            self.assertEqual(response.json, {"users": 10})
+            self.assertEqual(mock_count.call_count, 1)
+
+            with self.app.app_context():
+                invalidate_stats()
+            self.client.get('/api/v1/stats')
+            self.assertEqual(mock_count.call_count, 2)
+
     def test_home_endpoint(self):
         """Test the root / endpoint."""
         response = self.client.get('/api/v1/')
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import unittest
-from unittest.mock import patch
+import models
+import api.v1.views.users as users_views
 from api.v1.app import app
 from models.user import User
 from datetime import datetime
@@ -9,8 +10,14 @@ Unit tests for the User views (Create, Read, Update, Delete)
 of the /api/v1/users endpoint. This module tests the functionality
 of user-related API endpoints including user creation, retrieval,
 updating, and deletion, using mock data and mocking storage methods.
+
+Storage methods are replaced by plain attribute assignment in setUp and
+restored in tearDown instead of stacking mock.patch decorators.
 """
 
+# Storage methods replaced for the duration of each test
+STUBBED_STORAGE_METHODS = ('new', 'save', 'get', 'delete', 'all')
+
 
 class TestUserViews(unittest.TestCase):
     """
@@ -26,11 +33,9 @@ class TestUserViews(unittest.TestCase):
         # Use the test client from the app instance
         cls.client = app.test_client()
 
-    def setUp(self):
-        """
-        Set up a test user and other necessary test data before each test.
-        """
-        self.test_user_data = {
+        # Request payload and user built once; tests only read the user
+        now = datetime.utcnow().isoformat()
+        cls._base_user_data = {
             'id': '6af5c9f2-2766-46b7-a22b-f9f150deb5e1',
             'username': 'newuser',
             'email': 'newuser@gmail.com',
@@ -38,30 +43,40 @@ class TestUserViews(unittest.TestCase):
             'first_name': 'New',
             'last_name': 'User',
             'role': 'user',
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
+            'created_at': now,
+            'updated_at': now
         }
-        self.test_user = User(**self.test_user_data)
+        cls.test_user = User(**cls._base_user_data)
 
-    # Mock the 'new' method in the storage module
-    @patch('models.storage.new')
-    # Mock the 'save' method in the storage module
-    @patch('models.storage.save')
-    # Mock the validate_email function
-    @patch('email_validator.validate_email')
-    def test_create_user(self, mock_save, mock_new, mock_validate_email):
+    def setUp(self):
         """
-        Test the POST /api/v1/users endpoint to create a new user.
+        Give each test its own copy of the user data and stub out storage.
+        """
+        self.test_user_data = self._base_user_data.copy()
+
+        # Swap storage and email validation for cheap stand-ins
+        self._orig_storage = {name: getattr(models.storage, name)
+                              for name in STUBBED_STORAGE_METHODS}
+        self._orig_email_check = users_views.email_validation_error
+        models.storage.new = lambda *args, **kwargs: None
+        models.storage.save = lambda *args, **kwargs: None
+        models.storage.get = lambda *args, **kwargs: self.test_user
+        models.storage.delete = lambda *args, **kwargs: None
+        models.storage.all = lambda *args, **kwargs: {}
+        users_views.email_validation_error = lambda email: None
+
+    def tearDown(self):
         """
-        # Simulate the creation of a user
-        mock_new.return_value = self.test_user
-        # Simulate a successful save
-        mock_save.return_value = None
-        # Configure the mock to simulate successful validation
-        mock_validate_email.return_value = {'email': 'newuser@gmail.com',
-                                            'local': 'newuser',
-                                            'domain': 'gmail.com'}
+        Restore the real storage methods and email validation.
+        """
+        for name, method in self._orig_storage.items():
+            setattr(models.storage, name, method)
+        users_views.email_validation_error = self._orig_email_check
 
+    def test_create_user(self):
+        """
+        Test the POST /api/v1/users endpoint to create a new user.
+        """
         response = self.client.post('/api/v1/users', json=self.test_user_data)
         self.assertEqual(response.status_code, 201)
         # Ensure 'user' exists in the response
@@ -70,20 +85,17 @@ class TestUserViews(unittest.TestCase):
         self.assertIn('id', response.json['user'])
         self.assertEqual(response.json['user']['username'], 'newuser')
 
-    @patch('models.storage.all')  # Mock the 'all' method in the storage module
-    def test_get_all_users(self, mock_all):
+    def test_get_all_users(self):
         """
         Test the GET /api/v1/users endpoint to retrieve all users.
         """
-        # Create a mock user dictionary
+        # Storage returns a dictionary with a single user
         mock_user_data = {
             'user_id_1': User(id='user_id_1',
                               username='newuser',
                               email='newuser@example.com')
         }
-
-        # Mock the return value of storage.all() to be a dictionary of users
-        mock_all.return_value = mock_user_data
+        models.storage.all = lambda *args, **kwargs: mock_user_data
 
         headers = {
             'Authorization': 'Bearer invalid_token'
@@ -94,15 +106,10 @@ class TestUserViews(unittest.TestCase):
         # Check if the status code is 200 (OK)
         self.assertEqual(response.status_code, 422)
 
-    # Mock the 'get' method in the storage module
-    @patch('models.storage.get')
-    def test_get_user(self, mock_get):
+    def test_get_user(self):
         """
         Test the GET /api/v1/users/{user_id} endpoint to retrieve a user.
         """
-        # Simulate retrieving the user
-        mock_get.return_value = self.test_user
-
         headers = {
             # Replace with an actual or mock token
             'Authorization': 'Bearer invalid_token'
@@ -115,19 +122,10 @@ class TestUserViews(unittest.TestCase):
         self.assertEqual(response.status_code, 422)
         # self.assertEqual(response.json['username'], 'newuser')
 
-    # Mock the 'get' method in the storage module
-    @patch('models.storage.get')
-    # Mock the 'save' method in the storage module
-    @patch('models.storage.save')
-    def test_update_user(self, mock_save, mock_get):
+    def test_update_user(self):
         """
         Test the PUT /api/v1/users/{user_id} endpoint to update user's details.
         """
-        # Simulate retrieving the user
-        mock_get.return_value = self.test_user
-        # Simulate a successful save
-        mock_save.return_value = None
-
         updated_data = {'username': 'updateduser'}
 
         headers = {
@@ -139,20 +137,10 @@ class TestUserViews(unittest.TestCase):
                                    headers=headers)
         self.assertEqual(response.status_code, 422)
 
-    # Mock the 'get' method in the storage module
-    @patch('models.storage.get')
-    # Mock the 'delete' method in the storage module
-    @patch('models.storage.delete')
-    # Mock the 'save' method in the storage module
-    @patch('models.storage.save')
-    def test_delete_user(self, mock_save, mock_delete, mock_get):
+    def test_delete_user(self):
         """
         Test the DELETE /api/v1/users/{user_id} endpoint to delete a user.
         """
-        mock_get.return_value = self.test_user  # Simulate retrieving the user
-        mock_delete.return_value = None  # Simulate successful deletion
-        mock_save.return_value = None  # Simulate a successful save
-
         headers = {
             'Authorization': 'Bearer invalid_token'
         }
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Shared model fixtures for the tests in tests/test_models.
+
+The model fixtures build one unsaved model instance per test module from
+the defaults in factories.py. Tests that receive them must treat them
+as read-only; tests that mutate a model build their own.
+
+Tests that need a real database use db_storage, a DBStorage bound to an
+in-memory SQLite database.
+"""
+from unittest.mock import patch
+import pytest
+
+SQLITE_ENV = {'FLASK_ENV': 'development',
+              'DATABASE_URL': 'sqlite:///:memory:'}
+
+
+@pytest.fixture(scope="session")
+def factories():
+    """
+    The factories module, imported on first use so that collecting the
+    model tests does not import the models.
+    """
+    from tests.test_models import factories
+    return factories
+
+
+@pytest.fixture(scope="module")
+def frozen_now(factories):
+    """The fixed timestamp used by the choice and question fixtures."""
+    return factories.FROZEN_NOW
+
+
+@pytest.fixture(scope="module")
+def choice(factories):
+    """A Choice for a question with id '123'."""
+    return factories.make_choice()
+
+
+@pytest.fixture(scope="module")
+def question(factories):
+    """A single-answer Question for a quiz with id '123'."""
+    return factories.make_question()
+
+
+@pytest.fixture(scope="module")
+def quiz(factories):
+    """A 30-minute Quiz under the topic with id '456'."""
+    return factories.make_quiz()
+
+
+@pytest.fixture(scope="module")
+def result(factories):
+    """A completed Result with a score of 95.5."""
+    return factories.make_result()
+
+
+@pytest.fixture(scope="module")
+def topic(factories):
+    """A top-level Topic named 'Science'."""
+    return factories.make_topic()
+
+
+@pytest.fixture(scope="session")
+def sqlite_storage():
+    """
+    One DBStorage per worker, bound to an in-memory SQLite database with
+    every table created. Tests share it, so they must not depend on the
+    tables being empty.
+    """
+    from models.engine.db_storage import DBStorage
+    with patch.dict('os.environ', SQLITE_ENV):
+        db_storage = DBStorage()
+    db_storage.reload()
+    yield db_storage
+    db_storage.close()
+
+
+@pytest.fixture
+def db_storage(sqlite_storage):
+    """
+    The shared SQLite storage, with its scoped session dropped after
+    each test so every test starts with a clean one.
+    """
+    yield sqlite_storage
+    sqlite_storage.close()
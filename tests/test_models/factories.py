@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Factories for the unsaved model instances used across tests/test_models.
+
+Each make_* function builds a model from its read-only defaults mapping,
+with any keyword arguments overriding single fields:
+
+    make_choice(is_correct=False)
+"""
+from datetime import datetime, timezone
+from types import MappingProxyType
+from models.choice import Choice
+from models.question import Question
+from models.quiz import Quiz
+from models.result import Result, QuizSessionStatus
+from models.topic import Topic
+from models.user import User
+
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+CHOICE_DEFAULTS = MappingProxyType({
+    "question_id": "123",
+    "choice_text": "Paris",
+    "is_correct": True,
+    "order_number": 1,
+    "created_at": FROZEN_NOW,
+    "updated_at": FROZEN_NOW
+})
+
+QUESTION_DEFAULTS = MappingProxyType({
+    "quiz_id": "123",
+    "question_text": "What is the capital of France?",
+    "order_number": 1,
+    "allow_multiple_answers": False,
+    "created_at": FROZEN_NOW,
+    "updated_at": FROZEN_NOW
+})
+
+QUIZ_DEFAULTS = MappingProxyType({
+    "id": "123",
+    "topic_id": "456",
+    "title": "Sample Quiz",
+    "description": "A test quiz",
+    "time_limit": 30,
+    "created_at": FROZEN_NOW,
+    "updated_at": datetime(2024, 1, 1, 1, 0, 0, tzinfo=timezone.utc)
+})
+
+RESULT_DEFAULTS = MappingProxyType({
+    "user_id": "user123",
+    "quiz_id": "quiz123",
+    "score": 95.5,
+    "time_taken": 120,
+    "status": QuizSessionStatus.COMPLETED,
+    "submitted_at": "2025-01-01T12:00:00Z",
+    "start_time": "2025-01-01T11:00:00Z",
+    "end_time": "2025-01-01T12:00:00Z"
+})
+
+TOPIC_DEFAULTS = MappingProxyType({
+    "id": "123",
+    "name": "Science",
+    "parent_id": None
+})
+
+USER_DEFAULTS = MappingProxyType({
+    "first_name": "John",
+    "last_name": "Doe",
+    "username": "johndoe",
+    "email": "johndoe@example.com",
+    "password": "plainpassword"
+})
+
+
+def make_choice(**overrides):
+    """Builds a Choice from CHOICE_DEFAULTS."""
+    return Choice(**{**CHOICE_DEFAULTS, **overrides})
+
+
+def make_question(**overrides):
+    """Builds a Question from QUESTION_DEFAULTS."""
+    return Question(**{**QUESTION_DEFAULTS, **overrides})
+
+
+def make_quiz(**overrides):
+    """Builds a Quiz from QUIZ_DEFAULTS."""
+    return Quiz(**{**QUIZ_DEFAULTS, **overrides})
+
+
+def make_result(**overrides):
+    """Builds a Result from RESULT_DEFAULTS."""
+    return Result(**{**RESULT_DEFAULTS, **overrides})
+
+
+def make_topic(**overrides):
+    """Builds a Topic from TOPIC_DEFAULTS."""
+    return Topic(**{**TOPIC_DEFAULTS, **overrides})
+
+
+def make_user(**overrides):
+    """Builds a User from USER_DEFAULTS; the password gets hashed."""
+    return User(**{**USER_DEFAULTS, **overrides})
@@ -2,72 +2,73 @@
 """
 Contains tests for BaseModel class
 """
-import unittest
-from unittest.mock import patch, MagicMock
-from models.base_model import BaseModel
-from datetime import datetime
+import uuid
+import pytest
+from collections import Counter
+from models.base_model import BaseModel, Base, is_valid_uuid, time_format
+from models.engine.db_storage import classes
+from tests.test_models.factories import FROZEN_NOW
 
 
-class TestBaseModel(unittest.TestCase):
+@pytest.fixture(scope="module")
+def base_model_instance():
     """
-    Unit tests for the BaseModel class.
+    Builds one BaseModel instance shared by the read-only tests.
     """
+    return BaseModel(id="1234",
+                     created_at=FROZEN_NOW,
+                     updated_at=FROZEN_NOW)
 
-    def setUp(self):
-        """
-        Sets up a new BaseModel instance for each test case.
-        """
-        self.base_model_instance = BaseModel(id="1234",
-                                             created_at=datetime.now(),
-                                             updated_at=datetime.now())
 
-    def test_initialization(self):
-        """
-        Test the initialization of a BaseModel instance.
-        """
-        self.assertEqual(self.base_model_instance.id, "1234")
-        self.assertIsInstance(self.base_model_instance.created_at, datetime)
-        self.assertIsInstance(self.base_model_instance.updated_at, datetime)
+def test_initialization(base_model_instance):
+    """
+    Test the initialization of a BaseModel instance.
+    """
+    assert base_model_instance.id == "1234"
+    assert base_model_instance.created_at == FROZEN_NOW
+    assert base_model_instance.updated_at == FROZEN_NOW
 
-    @patch.object(BaseModel, 'save')
-    def test_save(self, mock_save):
-        """
-        Test the save method.
-        """
-        # Mock the save method
-        # Simulate that save doesn't raise errors
-        mock_save.return_value = None
-        self.base_model_instance.save()
-        mock_save.assert_called_once()
 
-    @patch.object(BaseModel, 'to_json')
-    def test_to_json(self, mock_to_json):
-        """
-        Test the to_dict method.
-        """
-        mock_to_json.return_value = {
-            'id': self.base_model_instance.id,
-            'created_at': self.base_model_instance.created_at.isoformat(),
-            'updated_at': self.base_model_instance.updated_at.isoformat()
-        }
-        result = self.base_model_instance.to_json()
-        self.assertEqual(result['id'], self.base_model_instance.id)
-        self.assertEqual(result['created_at'],
-                         self.base_model_instance.created_at.isoformat())
-        self.assertEqual(result['updated_at'],
-                         self.base_model_instance.updated_at.isoformat())
+def test_to_json(base_model_instance):
+    """
+    Test that to_json serializes the id and formats both timestamps.
+    """
+    result = base_model_instance.to_json()
+    assert result['id'] == base_model_instance.id
+    assert result['created_at'] == \
+        base_model_instance.created_at.strftime(time_format)
+    assert result['updated_at'] == \
+        base_model_instance.updated_at.strftime(time_format)
 
-    @patch.object(BaseModel, 'delete')
-    def test_delete(self, mock_delete):
-        """
-        Test the delete method.
-        """
-        # Mock the delete method
-        # Simulate that delete doesn't raise errors
-        mock_delete.return_value = None
-        self.base_model_instance.delete()
-        mock_delete.assert_called_once()
 
+def test_models_mapped_once():
+    """
+    Test that every model class is registered with exactly one mapper,
+    so duplicate model definitions fail loudly.
+    """
+    mapped = Counter(mapper.class_.__name__
+                     for mapper in Base.registry.mappers)
+    for cls in classes:
+        assert mapped[cls.__name__] == 1, cls.__name__
 
-if __name__ == '__main__':
-    unittest.main()
+
+_CANONICAL_ID = "12345678-1234-5678-1234-567812345678"
+
+
+@pytest.mark.parametrize("value,expected", [
+    (_CANONICAL_ID, True),
+    (uuid.UUID(_CANONICAL_ID), True),
+    (_CANONICAL_ID.upper(), False),
+    ("{" + _CANONICAL_ID + "}", False),
+    ("urn:uuid:" + _CANONICAL_ID, False),
+    (_CANONICAL_ID.replace("-", ""), False),
+    ("abc", False),
+    (None, False),
+], ids=["canonical", "uuid-object", "uppercase", "braces", "urn",
+        "undashed", "garbage", "none"])
+def test_is_valid_uuid(value, expected):
+    """
+    Test that only UUID objects and canonical id strings are accepted, so
+    stored ids and raw request ids always compare equal as strings.
+    """
+    assert is_valid_uuid(value) is expected
@@ -2,91 +2,161 @@
 """
 Contains tests for the DBStorage class
 for interacting with the MySQL database.
+
+The tests run the real storage methods against the in-memory SQLite
+storage from the db_storage fixture (see tests/test_models/conftest.py),
+so no MySQL server is needed.
 """
 
-import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
-from models import storage
-from models.user import User
-from sqlalchemy.orm import sessionmaker
-
-
-class TestDBStorage(unittest.TestCase):
-    """
-    Unit tests for DBStorage class methods.
-    """
-
-    @patch('models.engine.db_storage.create_engine')
-    def setUp(self, mock_create_engine):
-        """
-        Sets up a mock DBStorage instance and mocks database interactions.
-        """
-        # Mock the creation of the engine and sessionmaker
-        self.mock_engine = MagicMock()
-        self.mock_session = MagicMock()
-        mock_create_engine.return_value = self.mock_engine
-
-        # Mock the sessionmaker to return a mocked session
-        self.mock_session_factory = MagicMock()
-        self.mock_session_factory.return_value = self.mock_session
-        self.db_storage = storage
-        self.db_storage._DBStorage__session = self.mock_session
-
-    @patch('models.engine.db_storage.DBStorage.all')
-    def test_all(self, mock_all):
-        """
-        Test the 'all' method which retrieves all objects from the database.
-        """
-        mock_all.return_value = {'User.123': MagicMock(),
-                                 'User.456': MagicMock()}
-
-        result = self.db_storage.all(User)
-        self.assertEqual(len(result), 2)
-
-    @patch('models.engine.db_storage.DBStorage.new')
-    def test_new(self, mock_new):
-        """
-        Test the 'new' method which adds a new object to the session.
-        """
-        mock_obj = MagicMock()
-        self.db_storage.new(mock_obj)
-        mock_new.assert_called_once_with(mock_obj)
-
-    @patch('models.engine.db_storage.DBStorage.save')
-    def test_save(self, mock_save):
-        """
-        Test the 'save' method which commits changes to the database.
-        """
-        self.db_storage.save()
-        mock_save.assert_called_once()
-
-    @patch('models.engine.db_storage.DBStorage.delete')
-    def test_delete(self, mock_delete):
-        """
-        Test the 'delete' method which deletes an object from the session.
-        """
-        mock_obj = MagicMock()
-        self.db_storage.delete(mock_obj)
-        mock_delete.assert_called_once_with(mock_obj)
-
-    @patch('models.engine.db_storage.DBStorage.count')
-    def test_count(self, mock_count):
-        """
-        Test the 'count' method to ensure it counts
-        the number of objects correctly.
-        """
-        mock_count.return_value = 3
-        result = self.db_storage.count(User)
-        self.assertEqual(result, 3)
-
-    @patch('models.engine.db_storage.DBStorage.close')
-    def test_close(self, mock_close):
-        """
-        Test the 'close' method to ensure it closes the session correctly.
-        """
-        self.db_storage.close()
-        mock_close.assert_called_once()
-
-
-if __name__ == '__main__':
-    unittest.main()
+import pytest
+from models.engine.db_storage import DBStorage
+from models.refresh_token import RefreshToken
+from models.topic import Topic
+from sqlalchemy.exc import StatementError
+from sqlalchemy.pool import StaticPool
+
+
+def _add_topic(db_storage, name):
+    """
+    Stores and commits a Topic with the given name.
+    """
+    topic = Topic(name=name)
+    db_storage.new(topic)
+    db_storage.save()
+    return topic
+
+
+def test_new_and_save(db_storage):
+    """
+    Test that new() followed by save() persists the object.
+    """
+    topic = _add_topic(db_storage, 'Biology')
+    assert topic.id is not None
+    assert db_storage.get(Topic, topic.id) == topic
+
+
+def test_all(db_storage):
+    """
+    Test the 'all' method which retrieves all objects of a class.
+    """
+    topic = _add_topic(db_storage, 'Chemistry')
+    result = db_storage.all(Topic)
+    assert result['Topic.' + topic.id] is topic
+
+
+def test_get_unknown_class_or_id(db_storage):
+    """
+    Test that get() returns None for unregistered classes and
+    missing ids.
+    """
+    assert db_storage.get(dict, 'abc') is None
+    assert db_storage.get(Topic, 'abc') is None
+    assert db_storage.get(Topic,
+                          '00000000-0000-0000-0000-000000000000') is None
+
+
+def test_save_rejects_malformed_uuid(db_storage):
+    """
+    Test that a malformed id fails the write instead of being stored
+    as NULL.
+    """
+    db_storage.new(Topic(name='Astronomy', parent_id='not-a-uuid'))
+    with pytest.raises(StatementError, match='Invalid UUID'):
+        db_storage.save()
+
+
+def test_delete(db_storage):
+    """
+    Test the 'delete' method which removes an object from storage.
+    """
+    topic = _add_topic(db_storage, 'Geology')
+    db_storage.delete(topic)
+    db_storage.save()
+    assert db_storage.get(Topic, topic.id) is None
+
+
+def test_count(db_storage):
+    """
+    Test the 'count' method to ensure it counts
+    the number of objects correctly.
+    """
+    before = db_storage.count(Topic)
+    _add_topic(db_storage, 'Physics')
+    _add_topic(db_storage, 'Astronomy')
+    assert db_storage.count(Topic) == before + 2
+    assert db_storage.count(dict) == 0
+
+
+def test_filter_by(db_storage):
+    """
+    Test that filter_by() matches on mapped columns only.
+    """
+    topic = _add_topic(db_storage, 'Botany')
+    assert db_storage.filter_by(Topic, name='Botany') == [topic]
+    assert db_storage.filter_by(dict, name='Botany') == []
+
+
+def test_purge_expired_tokens(db_storage):
+    """
+    Test that purge_expired_tokens deletes expired refresh tokens and
+    keeps live ones. The cutoff is an aware datetime, so this also covers
+    its conversion to naive UTC by UTCDateTime.
+    """
+    user_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    expired = RefreshToken(token='purge-expired', user_id=user_id,
+                           expires_at=now - timedelta(minutes=1))
+    live = RefreshToken(token='purge-live', user_id=user_id,
+                        expires_at=now + timedelta(days=1))
+    db_storage.new(expired)
+    db_storage.new(live)
+    db_storage.save()
+    live_id = live.id
+
+    db_storage.purge_expired_tokens()
+
+    remaining = db_storage.query(RefreshToken.id).filter(
+        RefreshToken.user_id == user_id
+    ).all()
+    assert [row.id for row in remaining] == [live_id]
+
+
+def test_close(db_storage):
+    """
+    Test that close() discards the session, so a fresh one is used
+    for the next query.
+    """
+    topic = _add_topic(db_storage, 'Zoology')
+    session = db_storage._DBStorage__session
+    assert topic in session()
+    db_storage.close()
+    assert topic not in session()
+
+
+def test_save_flushes_before_commit():
+    """
+    Test that save() flushes pending changes and then commits.
+    """
+    storage_obj = DBStorage.__new__(DBStorage)
+    session = MagicMock()
+    storage_obj._DBStorage__session = session
+
+    storage_obj.save()
+
+    assert [c[0] for c in session.method_calls] == ['flush', 'commit']
+
+
+def test_sqlite_engine_uses_static_pool(db_storage):
+    """
+    Test that SQLite URLs get a single shared connection, so an
+    in-memory database persists across checkouts, and that storages
+    for the same URL share one engine.
+    """
+    engine = db_storage._DBStorage__engine
+    assert isinstance(engine.pool, StaticPool)
+    with patch.dict('os.environ', {'FLASK_ENV': 'development',
+                                   'DATABASE_URL': str(engine.url)}):
+        assert DBStorage()._DBStorage__engine is engine
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Contains tests for the NullStorage class, the database-free stand-in
+for DBStorage.
+"""
+
+import pytest
+from models.engine.null_storage import NullStorage
+from models.result import Result
+from models.user import User
+
+
+@pytest.fixture(scope="module")
+def null_storage():
+    """
+    One NullStorage for the module; it holds no state between calls.
+    """
+    return NullStorage()
+
+
+def test_reads_are_empty(null_storage):
+    """
+    Test that lookups find nothing.
+    """
+    assert null_storage.all(User) == {}
+    assert null_storage.get(User, "user123") is None
+    assert null_storage.get_by_value(User, "email", "a@b.c") is None
+    assert null_storage.filter_by(User, username="a") == []
+    assert null_storage.count(User) == 0
+
+
+def test_query_chain_is_empty(null_storage):
+    """
+    Test that chained queries and model helpers see no rows.
+    """
+    query = null_storage.query(User).filter_by(username="a").order_by(
+        User.created_at
+    )
+    assert query.all() == []
+    assert query.first() is None
+    assert Result.get_attempt_number(null_storage, "user123", "quiz123") == 0
+
+
+def test_writes_are_discarded(null_storage):
+    """
+    Test that writes succeed without a database.
+    """
+    user = User(username="newuser", email="newuser@example.com")
+    null_storage.new(user)
+    null_storage.save()
+    null_storage.delete(user)
+    null_storage.close()
+    assert null_storage.count() == 0
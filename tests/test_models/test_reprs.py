@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Checks the __repr__ output of every model with one parametrized test.
+
+The model instances come from the module-scoped fixtures in
+tests/test_models/conftest.py. Each case's fragments are compiled into
+one pattern at import time, so every repr is scanned once.
+"""
+import re
+import pytest
+
+
+def _in_order(*fragments):
+    """Compile a pattern matching the fragments in the given order."""
+    return re.compile(".*".join(map(re.escape, fragments)), re.DOTALL)
+
+
+REPR_CASES = [
+    ("choice", _in_order("Choice(id=",
+                         "question_id=123",
+                         "choice_text=Paris",
+                         "is_correct=True",
+                         "created_at=",
+                         "updated_at=")),
+    ("question", _in_order("Question(id=",
+                           "quiz_id=123",
+                           "question_text=What is the capital of France?",
+                           "allow_multiple_answers=False",
+                           "created_at=",
+                           "updated_at=")),
+    ("quiz", _in_order("Quiz(id=123, topic_id=456, title=Sample Quiz, "
+                       "description=A test quiz, "
+                       "time_limit=30, created_at=2024-01-01 00:00:00+00:00, "
+                       "updated_at=2024-01-01 01:00:00+00:00)")),
+    ("result", _in_order("Result(id=None, user_id=user123, quiz_id=quiz123, "
+                         "score=95.5, "
+                         "time_taken=120, status=QuizSessionStatus.COMPLETED, "
+                         "submitted_at=2025-01-01T12:00:00Z, "
+                         "start_time=2025-01-01T11:00:00Z, "
+                         "end_time=2025-01-01T12:00:00Z, "
+                         "created_at=None, updated_at=None)")),
+    ("topic", _in_order("Topic(id=123, name=Science, parent_id=None, "
+                        "created_at=None, updated_at=None)")),
+]
+
+
+@pytest.mark.parametrize("model,pattern", REPR_CASES,
+                         ids=[case[0] for case in REPR_CASES])
+def test_repr(request, model, pattern):
+    """Test that repr() of each model contains the expected fields."""
+    assert pattern.search(repr(request.getfixturevalue(model)))
@@ -1,71 +1,86 @@
 #!/usr/bin/env python3
 """
 Test suite for the Result class.
+
+The result and db_storage fixtures live in tests/test_models/conftest.py.
 """
-import unittest
-from unittest.mock import MagicMock
-from decimal import Decimal
+import uuid
+from datetime import timedelta
+import pytest
+from unittest.mock import create_autospec
+from sqlalchemy.orm import Query
 from models.result import Result, QuizSessionStatus
-from models import storage
+
+RESULT_EXPECTED_STR = ("[Result] (None) UserID: user123, "
+                       "QuizID: quiz123, Score: 95.5, "
+                       "Status: QuizSessionStatus.COMPLETED, Time Taken: 120s")
 
 
-class TestResult(unittest.TestCase):
+@pytest.fixture(scope="module")
+def mock_query():
     """
-    Test class for the Result model.
+    A Query mock checked against the real Query signatures, built once
+    per module; each test only sets the value it needs.
     """
+    query = create_autospec(Query, instance=True)
+    query.filter.return_value = query
+    return query
 
-    def setUp(self) -> None:
-        """
-        Sets up the test environment for each test case.
-        """
-        self.result = Result(
-            user_id="user123",
-            quiz_id="quiz123",
-            score=Decimal("95.00"),
-            time_taken=120,
-            status=QuizSessionStatus.COMPLETED,
-            submitted_at="2025-01-01T12:00:00Z",
-            start_time="2025-01-01T11:00:00Z",
-            end_time="2025-01-01T12:00:00Z"
-        )
 
-    def test_get_attempt_number(self) -> None:
-        """
-        Tests the get_attempt_number method.
-        """
-        # Mock the query filter and count method
-        mock_query = MagicMock()
-        mock_query.filter_by.return_value.count.return_value = 3
+@pytest.mark.parametrize("attempts", [0, 3])
+def test_get_attempt_number(result, storage_singleton, mock_query,
+                            monkeypatch, attempts) -> None:
+    """
+    Tests that get_attempt_number returns the count from the database.
+    """
+    mock_query.scalar.return_value = attempts
+    monkeypatch.setattr(storage_singleton, "query",
+                        lambda *args: mock_query)
 
-        # Assign the mock query to the Result class's query attribute
-        Result.query = mock_query
+    attempt_number = result.get_attempt_number(storage_singleton,
+                                               "user123", "quiz123")
+    assert attempt_number == attempts
 
-        # Call the method and assert the expected result
-        attempt_number = self.result.get_attempt_number(storage, "user123", "quiz123")
-        self.assertEqual(attempt_number, 0)
 
-    def test_str_method(self) -> None:
-        """
-        Tests the __str__ method.
-        """
-        expected_str = "[Result] (None) UserID: user123, " \
-                       "QuizID: quiz123, Score: 95.00, " \
-                       "Status: QuizSessionStatus.COMPLETED, Time Taken: 120s"
-        self.assertEqual(str(self.result), expected_str)
+def test_score_stored_in_hundredths(result) -> None:
+    """
+    Tests that the score is stored as an integer number of hundredths
+    and read back as a percentage.
+    """
+    assert result._score == 9550
+    assert result.score == 95.5
+    assert result.to_json()["score"] == 95.5
+
 
-    def test_repr_method(self) -> None:
-        """
-        Tests the __repr__ method.
-        """
-        expected_repr = ("Result(id=None, user_id=user123, quiz_id=quiz123, "
-                         "score=95.00, "
-                         "time_taken=120, status=QuizSessionStatus.COMPLETED, "
-                         "submitted_at=2025-01-01T12:00:00Z, "
-                         "start_time=2025-01-01T11:00:00Z, "
-                         "end_time=2025-01-01T12:00:00Z, "
-                         "created_at=None, updated_at=None)")
-        self.assertEqual(repr(self.result), expected_repr)
+def test_str_method(result) -> None:
+    """
+    Tests the __str__ method.
+    """
+    assert str(result) == RESULT_EXPECTED_STR
+
+
+def test_list_dicts(db_storage, factories) -> None:
+    """
+    Tests that list_dicts returns only the matching results, newest
+    first, with the score read back as a percentage.
+    """
+    user_id, quiz_id = str(uuid.uuid4()), str(uuid.uuid4())
+    older = Result(user_id=user_id, quiz_id=quiz_id, score=50.25,
+                   time_taken=60, status=QuizSessionStatus.COMPLETED,
+                   created_at=factories.FROZEN_NOW)
+    newer = Result(user_id=user_id, quiz_id=quiz_id, score=95.5,
+                   time_taken=120, status=QuizSessionStatus.TIMED_OUT,
+                   created_at=factories.FROZEN_NOW + timedelta(hours=1))
+    other = Result(user_id=str(uuid.uuid4()), quiz_id=quiz_id, score=10,
+                   created_at=factories.FROZEN_NOW)
+    for obj in (older, newer, other):
+        db_storage.new(obj)
+    db_storage.save()
 
+    rows = Result.list_dicts(db_storage, user_id=user_id)
 
-if __name__ == "__main__":
-    unittest.main()
+    assert [row["id"] for row in rows] == [newer.id, older.id]
+    assert [row["score"] for row in rows] == [95.5, 50.25]
+    assert rows[0]["time_taken (in seconds)"] == 120
+    assert rows[0]["status"] == "timed-out"
+    assert "_score" not in rows[0]
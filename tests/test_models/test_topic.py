@@ -1,67 +1,77 @@
 #!/usr/bin/env python3
 """
 Unit tests for the Topic model.
+
+The topic and db_storage fixtures live in tests/test_models/conftest.py.
 """
-import unittest
-from unittest.mock import MagicMock
 from models.topic import Topic
+from tests.test_models.factories import make_quiz, make_topic
+
+TOPIC_EXPECTED_STR = "[Topic] (123) Name: Science, Parent ID: None"
+
+
+def test_topic_initialization(topic):
+    """Test that a Topic instance is initialized correctly."""
+    assert topic.id == '123'
+    assert topic.name == 'Science'
+    assert topic.parent_id is None
+
+
+def test_str_representation(topic):
+    """Test the string representation of a Topic instance."""
+    assert str(topic) == TOPIC_EXPECTED_STR
+
+
+def test_relationships():
+    """Test relationships (quizzes and parent)."""
+    # Uses its own Topic since it assigns relationships
+    topic = make_topic()
+
+    # Plain unsaved models are enough; only identity is checked
+    quizzes = [make_quiz()]
+    topic.quizzes = quizzes
+
+    parent = make_topic(id='456', name='Natural Sciences')
+    topic.parent = parent
+
+    assert topic.quizzes == quizzes
+    assert topic.parent is parent
+
+
+def test_hierarchy():
+    """Test hierarchical structure with parent and subtopics."""
+    parent_topic = Topic(id='456', name='Math', parent_id=None)
+    child_topic = Topic(id='789', name='Algebra', parent_id='456')
+
+    # Mock subtopics relationship
+    parent_topic.subtopics = [child_topic]
+
+    assert parent_topic.subtopics[0].name == 'Algebra'
+    assert child_topic.parent_id == '456'
+
+
+def _add_topic(db_storage, name, parent=None):
+    """Stores and commits a Topic under the given parent."""
+    topic = Topic(name=name, parent_id=parent.id if parent else None)
+    db_storage.new(topic)
+    db_storage.save()
+    return topic
+
+
+def test_descendants(db_storage):
+    """
+    Test that descendants() returns the root and its whole subtree,
+    three levels deep, and leaves out the root's siblings and their
+    children.
+    """
+    parent = _add_topic(db_storage, 'Descendants Parent')
+    root = _add_topic(db_storage, 'Descendants Root', parent)
+    child = _add_topic(db_storage, 'Descendants Child', root)
+    grandchild = _add_topic(db_storage, 'Descendants Grandchild', child)
+    sibling = _add_topic(db_storage, 'Descendants Sibling', parent)
+    _add_topic(db_storage, 'Descendants Nephew', sibling)
 
+    subtree = Topic.descendants(db_storage, root.id)
 
-class TestTopicModel(unittest.TestCase):
-    """Test suite for the Topic model."""
-
-    def setUp(self):
-        """Set up mock data for tests."""
-        self.topic_data = {
-            'id': '123',
-            'name': 'Science',
-            'parent_id': None
-        }
-        self.topic = Topic(**self.topic_data)
-
-    def test_topic_initialization(self):
-        """Test that a Topic instance is initialized correctly."""
-        self.assertEqual(self.topic.id, self.topic_data['id'])
-        self.assertEqual(self.topic.name, self.topic_data['name'])
-        self.assertEqual(self.topic.parent_id, self.topic_data['parent_id'])
-
-    def test_str_representation(self):
-        """Test the string representation of a Topic instance."""
-        expected_str = "[Topic] (123) Name: Science, Parent ID: None"
-        self.assertEqual(str(self.topic), expected_str)
-
-    def test_repr_representation(self):
-        """Test the detailed string representation (__repr__)."""
-        expected_repr = (
-            "Topic(id=123, name=Science, parent_id=None, "
-            "created_at=None, updated_at=None)"
-        )
-        self.assertEqual(repr(self.topic), expected_repr)
-
-    def test_relationships(self):
-        """Test relationships (quizzes and parent)."""
-        # Mock quizzes relationship
-        mock_quizzes = [MagicMock()]
-        self.topic.quizzes = mock_quizzes
-
-        # Mock parent relationship
-        mock_parent = MagicMock()
-        self.topic.parent = mock_parent
-
-        self.assertEqual(self.topic.quizzes, mock_quizzes)
-        self.assertEqual(self.topic.parent, mock_parent)
-
-    def test_hierarchy(self):
-        """Test hierarchical structure with parent and subtopics."""
-        parent_topic = Topic(id='456', name='Math', parent_id=None)
-        child_topic = Topic(id='789', name='Algebra', parent_id='456')
-
-        # Mock subtopics relationship
-        parent_topic.subtopics = [child_topic]
-
-        self.assertEqual(parent_topic.subtopics[0].name, 'Algebra')
-        self.assertEqual(child_topic.parent_id, '456')
-
-
-if __name__ == '__main__':
-    unittest.main()
+    assert sorted(t.id for t in subtree) == sorted(
+        [root.id, child.id, grandchild.id])
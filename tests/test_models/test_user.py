@@ -1,113 +1,155 @@
 #!/usr/bin/env python3
-import unittest
-from unittest.mock import patch
-from models.user import User
 """
 Unit tests for the User class, focusing on password encryption, validation,
-and the set_password method. This module tests the interaction with bcrypt
-functions such as hashpw and gensalt to ensure correct password handling.
+and the set_password method. This module tests the interaction with the
+Argon2id password hasher (and bcrypt for legacy hashes) to ensure correct
+password handling.
 
 The tests include:
 - Verifying password encryption during user creation.
 - Validating password correctness with the check_password method.
+- Verifying legacy bcrypt hashes and flagging them for re-hashing.
+- Hashing every assigned value, even one that looks like a hash.
+- A round trip through the real Argon2 hasher (via real_hasher).
 - Ensuring the set_password method correctly encrypts and stores a new password
 """
+import pytest
+from unittest.mock import create_autospec
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
 
+ARGON2_HASH = '$argon2id$v=19$m=8,t=1,p=1$c2FsdHNhbHQ$hashedpassword'
+BCRYPT_HASH = '$2b$12$abcdefghijklmnoabcdefghi$hashedpassword'
 
-class TestUser(unittest.TestCase):
-    """
-    Test case for the User class, ensuring that password encryption and
-    validation methods function correctly.
-    """
-
-    def setUp(self):
-        """
-        Setup mock data and initialize a User instance for testing.
-        """
-        self.user_data = {
-            'first_name': 'John',
-            'last_name': 'Doe',
-            'username': 'johndoe',
-            'email': 'johndoe@example.com',
-            'password': 'plainpassword'
-        }
-        self.user = User(**self.user_data)
-
-    @patch('models.user.hashpw')  # Mocking bcrypt's hashpw function
-    @patch('models.user.gensalt')  # Mocking bcrypt's gensalt function
-    def test_password_encryption(self, mock_gensalt, mock_hashpw):
-        """
-        Test the encryption of the password when it is set.
-        """
-        # Mock the output of gensalt and hashpw
-        mock_salt = b'$2b$12$abcdefghijklmnoabcdefghi'
-        mock_gensalt.return_value = mock_salt
-        hashed_password = b'$2b$12$abcdefghijklmnoabcdefghi$hashedpassword'
-        mock_hashpw.return_value = hashed_password
-
-        # Set the password and check if it gets encrypted correctly
-        self.user.password = 'plainpassword'
-
-        # Assert that bcrypt functions were called
-        mock_gensalt.assert_called_once()
-        mock_hashpw.assert_called_once_with(b'plainpassword', mock_salt)
-
-        # Assert the encrypted password is stored in the User object
-        self.assertEqual(
-            self.user.password,
-            '$2b$12$abcdefghijklmnoabcdefghi$hashedpassword')
-
-    def test_check_password_valid(self):
-        """
-        Test the check_password method with a valid password.
-        """
-        # Set the password directly to simulate an encrypted password
-        self.user.password = '$2b$12$abcdefghijklmnoabcdefghi$hashedpassword'
-
-        # Mock checkpw to return True for the correct password
-        with patch('models.user.checkpw', return_value=True):
-            self.assertTrue(self.user.check_password('plainpassword'))
-
-    def test_check_password_invalid(self):
-        """
-        Test the check_password method with an invalid password.
-        """
-        # Set the password directly to simulate an encrypted password
-        self.user.password = '$2b$12$abcdefghijklmnoabcdefghi$hashedpassword'
-
-        # Mock checkpw to return False for an incorrect password
-        with patch('models.user.checkpw', return_value=False):
-            self.assertFalse(self.user.check_password('wrongpassword'))
+# Built once at import; the fake_ph fixture resets it for every test
+_FAKE_PH = create_autospec(PasswordHasher, instance=True)
 
+
+@pytest.fixture(autouse=True)
+def fake_ph(monkeypatch):
+    """
+    Swap the module's Argon2 hasher for the prebuilt fake. hash() returns
+    ARGON2_HASH unless a test says otherwise.
+    """
+    _FAKE_PH.reset_mock(return_value=True, side_effect=True)
+    _FAKE_PH.hash.return_value = ARGON2_HASH
+    monkeypatch.setattr('models.user._ph', _FAKE_PH)
+    return _FAKE_PH
+
+
+@pytest.fixture
+def user(factories, fake_ph):
+    """
+    Initialize a User instance for testing. Its password is hashed by the
+    fake to ARGON2_HASH, and the fake's call record is cleared so tests
+    only see their own calls. Function scoped because every test here
+    overwrites the password; a shallow copy of a module-scoped User would
+    share its SQLAlchemy instance state.
+    """
+    user = factories.make_user()
+    fake_ph.hash.reset_mock()
+    return user
+
+
+def test_password_encryption(user, fake_ph):
+    """
+    Test the encryption of the password when it is set.
+    """
+    # Set the password and check if it gets encrypted correctly
+    user.password = 'plainpassword'
+
+    # Assert that the hasher was called with the raw password
+    fake_ph.hash.assert_called_once_with('plainpassword')
+
+    # Assert the encrypted password is stored in the User object
+    assert user.password == ARGON2_HASH
+
+
+def test_password_that_looks_hashed_is_hashed(user, fake_ph):
+    """
+    Test that assigning a value that already looks like a hash still
+    hashes it instead of storing it as it is.
+    """
+    user.password = BCRYPT_HASH
+
+    fake_ph.hash.assert_called_once_with(BCRYPT_HASH)
+    assert user.password == ARGON2_HASH
+
+
+def _verify(hash, password):
+    """Stands in for PasswordHasher.verify; only 'plainpassword' matches."""
+    if password != 'plainpassword':
+        raise VerifyMismatchError()
+    return True
+
+
+@pytest.mark.parametrize("password,expected", [
+    ('plainpassword', True),
+    ('wrongpassword', False),
+], ids=["valid", "invalid"])
+def test_check_password(user, fake_ph, password, expected):
+    """
+    Test the check_password method with a valid and an invalid password.
+    """
+    fake_ph.verify.side_effect = _verify
+    assert user.check_password(password) is expected
+    fake_ph.verify.assert_called_once_with(ARGON2_HASH, password)
+
+
+def test_check_password_legacy_bcrypt(user, mocker):
+    """
+    Test that legacy bcrypt hashes are verified with bcrypt and
+    flagged for re-hashing.
+    """
+    # Stored hashes are only ever loaded, never assigned through the setter
+    user._password = BCRYPT_HASH
+
+    # Mock checkpw to return True for the correct password
+    mock_check = mocker.patch('models.user.checkpw', autospec=True,
+                              return_value=True)
+    assert user.check_password('plainpassword')
+    mock_check.assert_called_once_with(b'plainpassword',
+                                       BCRYPT_HASH.encode('utf-8'))
+    assert user.needs_rehash()
+
+
+def test_set_password(user, fake_ph, mocker):
+    """
+    Test the set_password method.
+    """
     # Mock the save method to avoid database interaction
-    @patch('models.user.User.save')
-    # Mocking bcrypt's hashpw function
-    @patch('models.user.hashpw')
-    # Mocking bcrypt's gensalt function
-    @patch('models.user.gensalt')
-    def test_set_password(self, mock_gensalt, mock_hashpw, mock_save):
-        """
-        Test the set_password method.
-        """
-        # Mock the output of gensalt and hashpw
-        mock_salt = b'$2b$12$abcdefghijklmnoabcdefghi'
-        mock_gensalt.return_value = mock_salt
-        hashed_password = b'$2b$12$abcdefghijklmnoabcdefghi$hashedpassword'
-        mock_hashpw.return_value = hashed_password
-
-        # Call set_password and check if password is set and saved correctly
-        self.user.set_password('newpassword')
-
-        # Assert that the password is hashed correctly
-        mock_hashpw.assert_called_once_with(b'newpassword', mock_salt)
-
-        # Assert the encrypted password is stored in the User object
-        self.assertEqual(self.user.password,
-                         '$2b$12$abcdefghijklmnoabcdefghi$hashedpassword')
-
-        # Ensure save method was called to persist the user with new password
-        mock_save.assert_called_once()
-
-
-if __name__ == '__main__':
-    unittest.main()
+    mock_save = mocker.patch('models.user.User.save', autospec=True)
+
+    # Call set_password and check if password is set and saved correctly
+    user.set_password('newpassword')
+
+    # Assert that the password is hashed correctly
+    fake_ph.hash.assert_called_once_with('newpassword')
+
+    # Assert the encrypted password is stored in the User object
+    assert user.password == ARGON2_HASH
+
+    # Ensure save method was called to persist the user with new password
+    mock_save.assert_called_once()
+
+
+def test_real_argon2_round_trip(factories, real_hasher):
+    """
+    Test hashing, verification and the re-hash check with the real Argon2
+    hasher in place of both the session stub and the fake.
+    """
+    user = factories.make_user(password='plainpassword')
+
+    assert user.password.startswith('$argon2id$')
+    assert user.check_password('plainpassword')
+    assert not user.check_password('wrongpassword')
+    assert not user.needs_rehash()
+
+    # A hash made with other cost parameters is flagged for re-hashing
+    user._password = PasswordHasher(
+        time_cost=real_hasher.time_cost + 1,
+        memory_cost=real_hasher.memory_cost,
+        parallelism=real_hasher.parallelism
+    ).hash('plainpassword')
+    assert user.check_password('plainpassword')
+    assert user.needs_rehash()
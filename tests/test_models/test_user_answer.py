@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
-import unittest
-from models.user_answer import UserAnswer
-from datetime import datetime
-from unittest.mock import patch
 """
 Unit tests for the UserAnswer model, which represents the answers provided
 by users in a quiz. The tests ensure that the initialization, string
-representation, and mocked behavior of the UserAnswer model work as expected.
+representation and storage helpers of the UserAnswer model work as expected.
 
 Key tests included in this module:
 - Verifying the correct initialization of a UserAnswer instance with the
@@ -14,53 +10,142 @@ Key tests included in this module:
   and updated_at).
 - Ensuring the __repr__ method of UserAnswer provides a meaningful string
   representation of the object.
-- Testing the mocked __repr__ method to ensure mocking functionality works
-  as expected.
-
-Mocking of the __repr__ method is used to isolate the behavior and avoid
-depending on the actual implementation.
+- Checking that bulk_create runs a single statement against a mocked
+  storage, and that get_user_answers filters and orders the answers
+  stored in the SQLite storage (db_storage, see conftest.py).
 """
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from types import MappingProxyType
+
+
+# Fixed timestamp: deterministic, and no clock read per fixture build
+_NOW = datetime(2024, 1, 1)
+
+USER_ANSWER_DATA = MappingProxyType({
+    "user_id": "user123",
+    "quiz_id": "quiz123",
+    "question_id": "question123",
+    "choice_id": "choice123",
+    "created_at": _NOW,
+    "updated_at": _NOW
+})
+
+EXPECTED_REPR = ("UserAnswer(user_id=user123, quiz_id=quiz123, "
+                 "question_id=question123, choice_id=choice123")
+
+
+@pytest.fixture(scope="module")
+def user_answer_cls():
+    """
+    The UserAnswer model, imported on first use so that collecting this
+    module does not import the models.
+    """
+    from models.user_answer import UserAnswer
+    return UserAnswer
+
+
+@pytest.fixture(scope="module")
+def user_answer(user_answer_cls):
+    """
+    Build one UserAnswer shared by the read-only tests in the module.
+    """
+    return user_answer_cls(**USER_ANSWER_DATA)
+
+
+def test_user_answer_initialization(user_answer):
+    """Test the initialization of a UserAnswer instance."""
+    assert user_answer.user_id == "user123"
+    assert user_answer.quiz_id == "quiz123"
+    assert user_answer.question_id == "question123"
+    assert user_answer.choice_id == "choice123"
+    assert user_answer.created_at == _NOW
+    assert user_answer.updated_at == _NOW
+
+
+def test_user_answer_repr(user_answer):
+    """Test the string representation (__repr__) of UserAnswer instance."""
+    assert EXPECTED_REPR in repr(user_answer)
+
+
+def test_user_answer_repr_cache_invalidated(user_answer_cls):
+    """Test the cached __repr__ follows changes to the shown IDs."""
+    # Uses its own instance since it reassigns choice_id
+    user_answer = user_answer_cls(**USER_ANSWER_DATA)
+    first = repr(user_answer)
+    assert repr(user_answer) is first
+
+    user_answer.choice_id = "choice456"
+    assert "choice_id=choice456" in repr(user_answer)
+
+
+def test_repr_cache_not_serialized(user_answer_cls):
+    """Test the cached __repr__ string never shows up in to_json()."""
+    user_answer = user_answer_cls(**USER_ANSWER_DATA)
+    repr(user_answer)
+
+    assert "_repr_cache" not in user_answer.to_json()
+    assert "_repr_cache" not in user_answer.to_json(for_serialization=True)
+
+
+def test_bulk_create_single_execute(user_answer_cls, mocker):
+    """Test bulk_create fills defaults and inserts all rows at once."""
+    storage = mocker.MagicMock()
+    rows = [
+        {"user_id": "user123", "quiz_id": "quiz123",
+         "question_id": f"question{i}", "choice_id": f"choice{i}",
+         "result_id": "result123"}
+        for i in range(3)
+    ]
+
+    returned = user_answer_cls.bulk_create(storage, rows)
+
+    assert returned is rows
+    storage.execute.assert_called_once()
+    assert storage.execute.call_args[0][1] is rows
+    assert len({row["id"] for row in rows}) == 3
+    for row in rows:
+        assert isinstance(row["created_at"], datetime)
+        assert row["created_at"] == row["updated_at"]
+
+
+def test_get_user_answers(user_answer_cls, db_storage):
+    """
+    Test get_user_answers against the SQLite storage: only the user's
+    answers come back, narrowed by quiz when asked, newest first.
+    """
+    user_id, quiz_id, other_quiz_id, result_id = (
+        str(uuid.uuid4()) for _ in range(4)
+    )
+
+    def add(quiz, hours, user=user_id):
+        """Stores an answer created `hours` after _NOW."""
+        created = _NOW + timedelta(hours=hours)
+        answer = user_answer_cls(
+            user_id=user, quiz_id=quiz, question_id=str(uuid.uuid4()),
+            choice_id=str(uuid.uuid4()), result_id=result_id,
+            created_at=created, updated_at=created
+        )
+        db_storage.new(answer)
+        return answer
+
+    older = add(quiz_id, 0)
+    other_quiz = add(other_quiz_id, 1)
+    newer = add(quiz_id, 2)
+    add(quiz_id, 3, user=str(uuid.uuid4()))
+    db_storage.save()
+
+    answers = user_answer_cls.get_user_answers(db_storage, user_id,
+                                               quiz_id=quiz_id)
+    assert [a.id for a in answers] == [newer.id, older.id]
+
+    answers = user_answer_cls.get_user_answers(db_storage, user_id)
+    assert [a.id for a in answers] == [newer.id, other_quiz.id, older.id]
 
 
-class TestUserAnswerModel(unittest.TestCase):
-    def setUp(self):
-        """Set up the test environment."""
-        # Initialize the UserAnswer model with mock data
-        self.user_answer_data = {
-            "user_id": "user123",
-            "quiz_id": "quiz123",
-            "question_id": "question123",
-            "choice_id": "choice123",
-            "created_at": datetime.now(),
-            "updated_at": datetime.now()
-        }
-
-        # Create a UserAnswer instance
-        self.user_answer = UserAnswer(**self.user_answer_data)
-
-    def test_user_answer_initialization(self):
-        """Test the initialization of a UserAnswer instance."""
-        self.assertEqual(self.user_answer.user_id, "user123")
-        self.assertEqual(self.user_answer.quiz_id, "quiz123")
-        self.assertEqual(self.user_answer.question_id, "question123")
-        self.assertEqual(self.user_answer.choice_id, "choice123")
-        self.assertIsInstance(self.user_answer.created_at, datetime)
-        self.assertIsInstance(self.user_answer.updated_at, datetime)
-
-    def test_user_answer_repr(self):
-        """Test the string representation (__repr__) of UserAnswer instance."""
-        user_answer_repr = repr(self.user_answer)
-        self.assertIn("UserAnswer(user_id=user123", user_answer_repr)
-        self.assertIn("quiz_id=quiz123", user_answer_repr)
-        self.assertIn("question_id=question123", user_answer_repr)
-        self.assertIn("choice_id=choice123", user_answer_repr)
-
-    @patch('models.user_answer.UserAnswer.__repr__')
-    def test_user_answer_repr_mocked(self, mock_repr):
-        """Test the mocked __repr__ method for UserAnswer."""
-        mock_repr.return_value = "Mocked UserAnswer String"
-        self.assertEqual(repr(self.user_answer), "Mocked UserAnswer String")
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_bulk_create_empty(user_answer_cls, mocker):
+    """Test bulk_create does not hit the database with no rows."""
+    storage = mocker.MagicMock()
+    assert user_answer_cls.bulk_create(storage, []) == []
+    storage.execute.assert_not_called()